@@ -46,7 +46,7 @@ def run_local_review(
         print(f"Summary: {result.summary_comment[:200]}...")
         print(f"\nInline Comments ({len(result.inline_comments)}):")
         for comment in result.inline_comments:
-            print(f"- {comment.get('path')}:{comment.get('line')} -> {comment.get('body')[:50]}...")
+            print(f"- {comment['file_path']}:{comment['line_number']} -> {comment['comment'][:50]}...")
             
     except Exception as e:
         print(f"\n[ERROR] Review failed: {e}")
@@ -19,6 +19,16 @@ class ReviewCrew:
         self.registry = AgentRegistry()
         self.graph = TaskGraph()
         self.crew: Optional[Crew] = None
+    
+    @staticmethod
+    def warmup():
+        """
+        Import the LLM client stack ahead of assemble().
+        
+        The first import of langchain_google_genai takes seconds; callers can
+        run this in a worker thread while they fetch PR data.
+        """
+        import langchain_google_genai  # noqa: F401
         
     def assemble(self, diff_content: str, pr_details: dict):
         """Assemble agents and tasks for a specific review context."""
@@ -106,7 +116,7 @@ class ReviewCrew:
                     import json
                     logger.info("crew_result_parsing_raw")
                     data = json.loads(result.raw)
-                    return GitHubReview(**data)
+                    return GitHubReview.from_llm(data)
                 except:
                     logger.warning("crew_result_parse_failed")
                     pass
@@ -1,5 +1,6 @@
+import asyncio
 from typing import Optional
-from data.models import ReviewInput, AgentOutput, GitHubReview
+from data.models import ReviewInput, AgentOutput, GitHubReview, REVIEW_STATES
 from core.config import ReviewConfig
 from core.crew import ReviewCrew
 from core.results import save_review_start, save_full_review_results
@@ -29,7 +30,8 @@ async def execute_review_pipeline(
         # 2. Crew Execution
         crew_runner = ReviewCrew(config)
         try:
-            raw_result = crew_runner.kickoff(review_input)
+            # kickoff blocks on LLM calls; run it off the event loop
+            raw_result = await asyncio.to_thread(crew_runner.kickoff, review_input)
         except Exception as e:
             logger.warning("kickoff_crashed_externally", error=str(e))
             raw_result = f"CRITICAL_SYSTEM_ERROR: {str(e)}"
@@ -83,7 +85,7 @@ async def execute_review_pipeline(
             else:
                 try:
                     result_data = json.loads(clean_json)
-                    final_review = GitHubReview(**result_data)
+                    final_review = GitHubReview.from_llm(result_data)
                 except (json.JSONDecodeError, Exception) as je:
                     logger.error("json_parse_failed", error=str(je), raw_preview=clean_json[:200])
                     # Emergency extraction - regex based to capture real line numbers
@@ -108,10 +110,15 @@ async def execute_review_pipeline(
                     summary_match = re.search(r'[\'"]summary_comment[\'"]\s*:\s*[\'"]([^\'"]+)[\'"]', str_content, re.DOTALL)
                     state_match = re.search(r'[\'"]review_state[\'"]\s*:\s*[\'"]([^\'"]+)[\'"]', str_content)
                     
+                    # Only trust a recovered state the model accepts
+                    review_state = state_match.group(1) if state_match else None
+                    if review_state not in REVIEW_STATES:
+                        review_state = "REQUESTED_CHANGES" if comments else "COMMENTED"
+                    
                     final_review = GitHubReview(
                         inline_comments=comments,
                         summary_comment=summary_match.group(1) if summary_match else "Parsed via emergency extraction due to JSON error.",
-                        review_state=state_match.group(1) if state_match else "REQUESTED_CHANGES" if comments else "COMMENTED"
+                        review_state=review_state
                     )
 
         # 4. DB Save Results
@@ -5,16 +5,19 @@ Handles SQLite connections and CRUD operations for reviews, findings, and agent
 
 import os
 import sqlite3
-import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import structlog
+from pydantic import TypeAdapter
 
 from .models import ReviewSummary, ReviewFinding, AgentOutput
 
 logger = structlog.get_logger()
 
+# Serializes agent findings straight to JSON (no intermediate dicts)
+_FINDINGS_JSON = TypeAdapter(List[ReviewFinding])
+
 
 def get_db_connection() -> sqlite3.Connection:
     """
@@ -197,7 +200,7 @@ def save_agent_output(review_id: int, agent_output: AgentOutput) -> None:
         cursor = conn.cursor()
         
         # Serialize findings to JSON
-        raw_output = json.dumps([f.model_dump() for f in agent_output.findings])
+        raw_output = _FINDINGS_JSON.dump_json(agent_output.findings).decode()
         
         cursor.execute("""
             INSERT INTO agent_outputs (
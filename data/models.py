@@ -4,8 +4,10 @@ Provides validation and serialization for agent outputs and review summaries.
 """
 
 from datetime import datetime, timezone
-from typing import Literal, Optional, Union, List
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import Literal, Optional, Union, List, get_args
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator
+# pydantic needs typing_extensions' TypedDict before Python 3.12
+from typing_extensions import Required, TypedDict
 
 
 class ReviewFinding(BaseModel):
@@ -104,15 +106,95 @@ class ComprehensiveReviewAnalysis(BaseModel):
     """Container for the multi-agent consolidated analysis."""
     findings: List[ReviewFinding] = Field(..., description="List of all detected issues")
 
-class InlineComment(BaseModel):
-    """Represents a single inline comment on a file."""
-    file_path: str = Field("unknown", description="Path to the file being reviewed")
-    line_number: int = Field(1, description="Line number in the file")
-    comment: str = Field(..., description="The review comment text")
+class InlineComment(TypedDict, total=False):
+    """
+    Represents a single inline comment on a file.
+    
+    A plain dict (validated per item by pydantic-core) rather than a nested
+    model. GitHubReview fills in file_path ("unknown") and line_number (1)
+    when the LLM omits them, so every comment it holds has all three keys.
+    """
+    file_path: str  # Path to the file being reviewed
+    line_number: int  # Line number in the file
+    comment: Required[str]  # The review comment text
+
+# Validates a comment list in one pydantic-core call (built once at import)
+_INLINE_LIST_ADAPTER = TypeAdapter(List[InlineComment])
+
+# Values for the optional InlineComment keys
+_INLINE_DEFAULTS = {"file_path": "unknown", "line_number": 1}
+
+
+def _with_defaults(comments: List[InlineComment]) -> List[InlineComment]:
+    """Fill missing optional keys in place on freshly validated comments."""
+    for comment in comments:
+        if len(comment) < 3:
+            for key, value in _INLINE_DEFAULTS.items():
+                comment.setdefault(key, value)
+    return comments
+
+# Review verdicts the formatting task may return (REQUESTED_CHANGES is the
+# commenter's spelling; REQUEST_CHANGES is what the task prompt asks for)
+ReviewState = Literal["APPROVED", "REQUEST_CHANGES", "COMMENTED", "REQUESTED_CHANGES"]
+REVIEW_STATES = frozenset(get_args(ReviewState))
 
 class GitHubReview(BaseModel):
     """Represents the final review to be posted to GitHub."""
     inline_comments: List[InlineComment] = Field(default_factory=list, description="List of inline comments for changed lines")
     summary_comment: str = Field(..., description="Overall summary of the review")
-    review_state: str = Field(..., description="Review state: APPROVED, REQUEST_CHANGES, or COMMENTED")
+    review_state: ReviewState = Field(..., description="Review state: APPROVED, REQUEST_CHANGES, or COMMENTED")
     pre_existing_findings: List[InlineComment] = Field(default_factory=list, description="Findings on unchanged lines (full_file mode only)")
+    
+    # Immutable once built; instances passed back in are reused, not re-validated
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+    
+    @field_validator("inline_comments", "pre_existing_findings")
+    @classmethod
+    def _fill_comment_defaults(cls, v: List[InlineComment]) -> List[InlineComment]:
+        """Give every comment a file_path and line_number."""
+        return _with_defaults(v)
+    
+    @classmethod
+    def from_llm(cls, raw: dict) -> "GitHubReview":
+        """
+        Build a review from the parsed JSON the formatting task produced.
+        
+        The comment lists go through the shared list adapter and the outer
+        shell is assembled with model_construct (its two scalar fields are
+        checked here, review_state against REVIEW_STATES), skipping a second pass over the parent model.
+        
+        Args:
+            raw: Dict decoded from the LLM output
+            
+        Returns:
+            GitHubReview instance
+            
+        Raises:
+            KeyError: If summary_comment or review_state is missing
+            ValueError: If a field has the wrong type or review_state is unknown
+        """
+        summary_comment = raw["summary_comment"]
+        review_state = raw["review_state"]
+        if not isinstance(summary_comment, str):
+            raise ValueError("summary_comment must be a string")
+        if review_state not in REVIEW_STATES:
+            raise ValueError(f"Unknown review_state: {review_state!r}")
+        
+        return cls.model_construct(
+            inline_comments=_with_defaults(_INLINE_LIST_ADAPTER.validate_python(raw.get("inline_comments") or [])),
+            summary_comment=summary_comment,
+            review_state=review_state,
+            pre_existing_findings=_with_defaults(_INLINE_LIST_ADAPTER.validate_python(raw.get("pre_existing_findings") or [])),
+        )
+    
+    def to_json(self) -> str:
+        """
+        Serialize the review to JSON in a single pydantic-core pass.
+        
+        Use this rather than json.dumps(review.model_dump()), which builds
+        an intermediate dict tree first.
+        
+        Returns:
+            Compact JSON string (None values omitted)
+        """
+        return self.model_dump_json(exclude_none=True)
@@ -6,27 +6,43 @@ Provides production-ready GitHub client for:
 - Posting inline code review comments
 - Mock data for testing without API calls
 - Webhook event handling (Phase 9)
+
+Exports are resolved lazily (PEP 562) so importing the package does not pull
+in PyGithub, cryptography and PyJWT until a name that needs them is used.
 """
 
-from .client import GitHubClient
-from .pr_fetcher import PRFetcher, PRData, FileChange
-from .commenter import GitHubCommenter
-from .mocks import MockPRData
-from .webhook_handler import WebhookHandler
-from .signature import verify_webhook_signature, generate_webhook_signature
-from .app_auth import GitHubAppAuth
-from .installation import InstallationManager
-
-__all__ = [
-    "GitHubClient",
-    "PRFetcher",
-    "PRData",
-    "FileChange",
-    "GitHubCommenter",
-    "MockPRData",
-    "WebhookHandler",
-    "verify_webhook_signature",
-    "generate_webhook_signature",
-    "GitHubAppAuth",
-    "InstallationManager",
-]
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "GitHubClient": ".client",
+    "PRSummary": ".client",
+    "PRFile": ".client",
+    "PRFetcher": ".pr_fetcher",
+    "PRData": ".pr_fetcher",
+    "FileChange": ".pr_fetcher",
+    "GitHubCommenter": ".commenter",
+    "MockPRData": ".mocks",
+    "WebhookHandler": ".webhook_handler",
+    "verify_webhook_signature": ".signature",
+    "generate_webhook_signature": ".signature",
+    "GitHubAppAuth": ".app_auth",
+    "InstallationManager": ".installation",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
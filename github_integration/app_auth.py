@@ -7,11 +7,8 @@ Provides production-ready authentication with enhanced rate limits and security.
 
 import os
 import time
-import jwt
 from datetime import datetime, timedelta
 from typing import Optional
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.backends import default_backend
 import httpx
 import structlog
 
@@ -54,13 +51,23 @@ class GitHubAppAuth:
             FileNotFoundError: If private key file not found
             ValueError: If private key format is invalid
         """
+        # Deferred: cryptography is only needed in GitHub App mode
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.backends import default_backend
+        
         try:
-            with open(self.private_key_path, 'rb') as key_file:
-                private_key = serialization.load_pem_private_key(
-                    key_file.read(),
-                    password=None,
-                    backend=default_backend()
-                )
+            # Unbuffered read: the key is small and read exactly once
+            fd = os.open(self.private_key_path, os.O_RDONLY)
+            try:
+                key_data = os.read(fd, os.fstat(fd).st_size)
+            finally:
+                os.close(fd)
+            
+            private_key = serialization.load_pem_private_key(
+                key_data,
+                password=None,
+                backend=default_backend()
+            )
             
             logger.info(
                 "private_key_loaded",
@@ -101,6 +108,8 @@ class GitHubAppAuth:
             >>> print(jwt_token[:20])
             eyJhbGciOiJSUzI1NiI...
         """
+        import jwt
+        
         # Current time
         now = int(time.time())
         
@@ -4,17 +4,22 @@ GitHubClient - Authenticated GitHub API client
 Handles:
 - Personal Access Token authentication (Phase 8)
 - GitHub App JWT + Installation tokens (Phase 10)
-- Rate limiting with exponential backoff
+- Rate limiting with jittered exponential backoff (tenacity)
 - Error handling and retries
 """
 
 import os
+import gzip
 import time
-from typing import Optional, Dict, Any, Literal
+import asyncio
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, AsyncIterator, List, Literal, Tuple
 from github import Github, GithubException
 from github.PullRequest import PullRequest
 from github.Repository import Repository
 import httpx
+import orjson
+import tenacity
 from dotenv import load_dotenv
 import structlog
 
@@ -22,6 +27,133 @@ load_dotenv()
 
 logger = structlog.get_logger()
 
+# Review payloads smaller than this are sent uncompressed
+GZIP_MIN_BYTES = 1024
+
+# Status codes worth retrying: rate limiting and transient gateway errors
+RETRYABLE_STATUS_CODES = (429, 502, 503)
+
+# POSTs may already have been applied when a gateway error comes back, so they
+# only retry when GitHub rejected the request outright
+POST_RETRYABLE_STATUS_CODES = (429,)
+
+# GitHub's maximum page size for list endpoints (the default is 30)
+FILES_PER_PAGE = 100
+
+# Installation tokens are valid for an hour; reuse each one for a bit less
+INSTALLATION_TOKEN_TTL_SECONDS = 50 * 60
+
+
+def _is_retryable_error(exc: BaseException) -> bool:
+    """Return True for rate-limit/transient errors from either PyGithub or httpx."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    if isinstance(exc, GithubException):
+        return exc.status in RETRYABLE_STATUS_CODES
+    return False
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    """Return True when an httpx POST was rejected before GitHub processed it."""
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in POST_RETRYABLE_STATUS_CODES
+    )
+
+
+def _log_retry(retry_state: tenacity.RetryCallState):
+    """Log each backoff before sleeping."""
+    logger.warning(
+        "github_api_retry",
+        attempt=retry_state.attempt_number,
+        wait_seconds=round(retry_state.next_action.sleep, 2),
+        error=str(retry_state.outcome.exception())
+    )
+
+
+# Jittered exponential backoff so concurrent clients don't retry in lockstep
+_retry_on_rate_limit = tenacity.retry(
+    retry=tenacity.retry_if_exception(_is_retryable_error),
+    wait=tenacity.wait_random_exponential(multiplier=1, max=30),
+    stop=tenacity.stop_after_attempt(4),
+    before_sleep=_log_retry,
+    reraise=True
+)
+
+# Same backoff for non-idempotent POSTs, but only on 429 so a retry can't
+# post a review or comment twice
+_retry_post_on_rate_limit = tenacity.retry(
+    retry=tenacity.retry_if_exception(_is_rate_limited),
+    wait=tenacity.wait_random_exponential(multiplier=1, max=30),
+    stop=tenacity.stop_after_attempt(4),
+    before_sleep=_log_retry,
+    reraise=True
+)
+
+
+@dataclass(slots=True)
+class PRSummary:
+    """Flattened PR metadata from the REST API (the fields reviews actually use)."""
+    number: int
+    title: str
+    state: str
+    author: str
+    html_url: str
+    head_sha: str
+    head_ref: str
+    base_sha: str
+    base_ref: str
+    body: str = ""
+    
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "PRSummary":
+        """Build from a `GET /repos/{repo}/pulls/{number}` response payload."""
+        head = data.get("head") or {}
+        base = data.get("base") or {}
+        return cls(
+            number=data.get("number", 0),
+            title=data.get("title", ""),
+            state=data.get("state", ""),
+            author=(data.get("user") or {}).get("login", ""),
+            html_url=data.get("html_url", ""),
+            head_sha=head.get("sha", ""),
+            head_ref=head.get("ref", ""),
+            base_sha=base.get("sha", ""),
+            base_ref=base.get("ref", ""),
+            body=data.get("body") or ""
+        )
+
+
+@dataclass(slots=True)
+class PRFile:
+    """A changed file from `GET /repos/{repo}/pulls/{number}/files`."""
+    filename: str
+    status: str
+    additions: int
+    deletions: int
+    changes: int
+    patch: str = ""
+    
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "PRFile":
+        """Build from one entry of the files listing (binary files have no patch)."""
+        return cls(
+            filename=data.get("filename", ""),
+            status=data.get("status", ""),
+            additions=data.get("additions", 0),
+            deletions=data.get("deletions", 0),
+            changes=data.get("changes", 0),
+            patch=data.get("patch") or ""
+        )
+
+
+def _last_page(response: httpx.Response) -> int:
+    """Read the page count from a paginated response's `Link: rel="last"` header."""
+    last = response.links.get("last")
+    if not last:
+        return 1
+    return int(httpx.URL(last["url"]).params.get("page", 1))
+
 
 class GitHubClient:
     """Authenticated GitHub API client with dual-mode authentication and rate limiting."""
@@ -43,25 +175,19 @@ class GitHubClient:
         self.app_auth = None
         self.installation_manager = None
         
+        # Precomputed Authorization header, passed per request (token mode;
+        # app mode builds one per installation, see _request_headers)
+        self._auth_header: Dict[str, str] = {}
+        
+        # installation_id -> (expiry on the monotonic clock, installation token)
+        self._installation_tokens: Dict[int, Tuple[float, str]] = {}
+        
         if auth_mode == "token":
             # Personal Access Token mode (Phase 8)
-            self.token = token or os.getenv("GITHUB_TOKEN")
-            if not self.token:
-                raise ValueError(
-                    "GitHub token not found. Set GITHUB_TOKEN environment variable "
-                    "or pass token to GitHubClient constructor."
-                )
-            
-            # Initialize PyGithub client
-            self.github = Github(self.token)
-            
-            # Async HTTP client for additional API calls
-            self.http_client = httpx.AsyncClient(
-                headers={
-                    "Authorization": f"token {self.token}",
-                    "Accept": "application/vnd.github.v3+json"
-                },
-                timeout=30.0
+            self._init_token_auth(
+                token or os.getenv("GITHUB_TOKEN"),
+                "GitHub token not found. Set GITHUB_TOKEN environment variable "
+                "or pass token to GitHubClient constructor."
             )
             
             logger.info("github_client_initialized", auth_mode="token")
@@ -85,12 +211,6 @@ class GitHubClient:
                 # Initialize installation manager
                 self.installation_manager = InstallationManager()
                 
-                # HTTP client (will be updated with installation token per request)
-                self.http_client = httpx.AsyncClient(
-                    headers={"Accept": "application/vnd.github.v3+json"},
-                    timeout=30.0
-                )
-                
                 # PyGithub client will be initialized with installation token
                 self.github = None
                 
@@ -102,25 +222,35 @@ class GitHubClient:
                 # Fallback to token mode
                 logger.warning("falling_back_to_token_auth")
                 self.auth_mode = "token"
-                self.token = os.getenv("GITHUB_TOKEN")
-                
-                if not self.token:
-                    raise ValueError(
-                        f"GitHub App authentication failed: {e}. "
-                        "Fallback to token mode also failed (no GITHUB_TOKEN)."
-                    )
-                
-                self.github = Github(self.token)
-                self.http_client = httpx.AsyncClient(
-                    headers={
-                        "Authorization": f"token {self.token}",
-                        "Accept": "application/vnd.github.v3+json"
-                    },
-                    timeout=30.0
+                self._init_token_auth(
+                    os.getenv("GITHUB_TOKEN"),
+                    f"GitHub App authentication failed: {e}. "
+                    "Fallback to token mode also failed (no GITHUB_TOKEN)."
                 )
         
         else:
             raise ValueError(f"Invalid auth_mode: {auth_mode}. Must be 'token' or 'app'.")
+        
+        # Async HTTP client for additional API calls (shared by both auth modes)
+        self.http_client = httpx.AsyncClient(
+            headers={"Accept": "application/vnd.github.v3+json"},
+            timeout=30.0
+        )
+    
+    def _init_token_auth(self, token: Optional[str], missing_token_error: str):
+        """
+        Configure Personal Access Token authentication.
+        
+        Args:
+            token: GitHub Personal Access Token
+            missing_token_error: Error message raised when token is empty
+        """
+        if not token:
+            raise ValueError(missing_token_error)
+        
+        self.token = token
+        self.github = Github(token)
+        self._auth_header = {"Authorization": f"token {token}"}
     
     async def get_access_token(self, repo_full_name: Optional[str] = None) -> str:
         """
@@ -145,30 +275,41 @@ class GitHubClient:
             if not installation_id:
                 raise ValueError(f"No installation found for {repo_full_name}")
             
-            # Get installation token
+            # Reuse this installation's token until shortly before it expires
+            cached = self._installation_tokens.get(installation_id)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            
             installation_token = await self.app_auth.get_installation_token(installation_id)
+            self._installation_tokens[installation_id] = (
+                time.monotonic() + INSTALLATION_TOKEN_TTL_SECONDS,
+                installation_token
+            )
             
             return installation_token
         
         return ""
-
-        
-    def _handle_rate_limit(self, retry_count: int = 0, max_retries: int = 3):
+    
+    async def _request_headers(self, repo: str) -> Dict[str, str]:
         """
-        Handle rate limiting with exponential backoff.
+        Authorization header for a request against `repo`.
+        
+        In app mode each call gets its own dict holding the repo's
+        installation token, so concurrent reviews of repos in different
+        installations never share (or overwrite) a header.
         
         Args:
-            retry_count: Current retry attempt
-            max_retries: Maximum number of retries
+            repo: Full repo name (owner/repo)
+            
+        Returns:
+            Headers dict (treat as read-only)
         """
-        if retry_count >= max_retries:
-            raise Exception(f"Max retries ({max_retries}) exceeded for rate limiting")
-        
-        # Exponential backoff: 2^retry_count seconds
-        wait_time = 2 ** retry_count
-        print(f"Rate limit hit. Waiting {wait_time}s before retry {retry_count + 1}/{max_retries}...")
-        time.sleep(wait_time)
+        if self.auth_mode == "app":
+            return {"Authorization": f"token {await self.get_access_token(repo)}"}
+        return self._auth_header
+
     
+    @_retry_on_rate_limit
     def get_repo(self, owner: str, repo: str) -> Repository:
         """
         Get repository object.
@@ -183,23 +324,20 @@ class GitHubClient:
         Raises:
             GithubException: If repo not found or access denied
         """
-        retry_count = 0
-        while retry_count < 3:
-            try:
-                return self.github.get_repo(f"{owner}/{repo}")
-            except GithubException as e:
-                if e.status == 429:  # Rate limit
-                    self._handle_rate_limit(retry_count)
-                    retry_count += 1
-                elif e.status == 404:
-                    raise ValueError(f"Repository {owner}/{repo} not found")
-                elif e.status == 403:
-                    raise ValueError(f"Access denied to {owner}/{repo}. Check token permissions.")
-                else:
-                    raise
-        
-        raise Exception("Failed to get repository after retries")
+        return self._get_repo(owner, repo)
+    
+    def _get_repo(self, owner: str, repo: str) -> Repository:
+        """Fetch a repository without retrying (callers own the retry policy)."""
+        try:
+            return self.github.get_repo(f"{owner}/{repo}")
+        except GithubException as e:
+            if e.status == 404:
+                raise ValueError(f"Repository {owner}/{repo} not found")
+            elif e.status == 403:
+                raise ValueError(f"Access denied to {owner}/{repo}. Check token permissions.")
+            raise
     
+    @_retry_on_rate_limit
     def get_pr(self, owner: str, repo: str, pr_number: int) -> PullRequest:
         """
         Get pull request object.
@@ -215,23 +353,17 @@ class GitHubClient:
         Raises:
             GithubException: If PR not found
         """
-        retry_count = 0
-        while retry_count < 3:
-            try:
-                repository = self.get_repo(owner, repo)
-                return repository.get_pull(pr_number)
-            except GithubException as e:
-                if e.status == 429:
-                    self._handle_rate_limit(retry_count)
-                    retry_count += 1
-                elif e.status == 404:
-                    raise ValueError(f"PR #{pr_number} not found in {owner}/{repo}")
-                else:
-                    raise
-        
-        raise Exception("Failed to get PR after retries")
+        # Retries happen once, around the whole lookup
+        repository = self._get_repo(owner, repo)
+        try:
+            return repository.get_pull(pr_number)
+        except GithubException as e:
+            if e.status == 404:
+                raise ValueError(f"PR #{pr_number} not found in {owner}/{repo}")
+            raise
     
-    async def get_pr_data(self, repo: str, pr_number: int) -> Dict[str, Any]:
+    @_retry_on_rate_limit
+    async def get_pr_data(self, repo: str, pr_number: int) -> PRSummary:
         """
         Fetch PR metadata via REST API.
         
@@ -240,33 +372,93 @@ class GitHubClient:
             pr_number: PR number
             
         Returns:
-            Dict with PR data
+            PRSummary with the PR metadata
         """
         url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}"
         
-        retry_count = 0
-        while retry_count < 3:
-            try:
-                response = await self.http_client.get(url)
-                
-                if response.status_code == 429:
-                    self._handle_rate_limit(retry_count)
-                    retry_count += 1
-                    continue
-                
-                response.raise_for_status()
-                return response.json()
+        try:
+            response = await self.http_client.get(url, headers=await self._request_headers(repo))
+            response.raise_for_status()
+            return PRSummary.from_api(orjson.loads(response.content))
+        
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                raise ValueError(f"PR #{pr_number} not found in {repo}")
+            elif e.response.status_code == 403:
+                raise ValueError(f"Access denied. Check token permissions.")
+            raise
+    
+    @_retry_on_rate_limit
+    async def _get_pr_files_page(self, url: str, page: int, headers: Dict[str, str]) -> httpx.Response:
+        """Fetch one page of a PR's changed files."""
+        response = await self.http_client.get(
+            url,
+            params={"per_page": FILES_PER_PAGE, "page": page},
+            headers=headers
+        )
+        response.raise_for_status()
+        return response
+    
+    async def iter_pr_files(self, repo: str, pr_number: int) -> AsyncIterator[PRFile]:
+        """
+        Stream the changed files of a PR via REST API, page by page.
+        
+        The first page reveals the page count through its Link header; the
+        remaining pages are then requested concurrently and yielded in order
+        as soon as each one (and those before it) has arrived.
+        
+        Args:
+            repo: Full repo name (owner/repo)
+            pr_number: PR number
             
+        Yields:
+            PRFile in API order
+        """
+        url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}/files"
+        pending: List[asyncio.Task] = []
+        headers = await self._request_headers(repo)
+        
+        try:
+            try:
+                first = await self._get_pr_files_page(url, 1, headers)
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 404:
                     raise ValueError(f"PR #{pr_number} not found in {repo}")
-                elif e.response.status_code == 403:
-                    raise ValueError(f"Access denied. Check token permissions.")
-                else:
-                    raise
+                raise
+            
+            last_page = _last_page(first)
+            pending = [
+                asyncio.create_task(self._get_pr_files_page(url, page, headers))
+                for page in range(2, last_page + 1)
+            ]
+            
+            for item in orjson.loads(first.content):
+                yield PRFile.from_api(item)
+            for task in pending:
+                for item in orjson.loads((await task).content):
+                    yield PRFile.from_api(item)
+            
+            logger.info("pr_files_fetched", repo=repo, pr_number=pr_number, pages=last_page)
         
-        raise Exception("Failed to get PR data after retries")
+        finally:
+            # Consumer stopped early or a page failed: don't leave requests running
+            for task in pending:
+                task.cancel()
     
+    async def get_pr_files(self, repo: str, pr_number: int) -> List[PRFile]:
+        """
+        Fetch all changed files of a PR via REST API.
+        
+        Args:
+            repo: Full repo name (owner/repo)
+            pr_number: PR number
+            
+        Returns:
+            List of PRFile in API order
+        """
+        return [f async for f in self.iter_pr_files(repo, pr_number)]
+    
+    @_retry_post_on_rate_limit
     async def create_review(
         self,
         repo: str,
@@ -296,28 +488,27 @@ class GitHubClient:
             "comments": comments
         }
         
-        retry_count = 0
-        while retry_count < 3:
-            try:
-                response = await self.http_client.post(url, json=payload)
-                
-                if response.status_code == 429:
-                    self._handle_rate_limit(retry_count)
-                    retry_count += 1
-                    continue
-                
-                response.raise_for_status()
-                result = response.json()
-                return str(result.get("id", ""))
-            
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 422:
-                    raise ValueError(f"Invalid review data: {e.response.text}")
-                else:
-                    raise
+        # Large reviews (many markdown comments) compress well; level 1 is cheap
+        body_bytes = orjson.dumps(payload)
+        headers = {**await self._request_headers(repo), "Content-Type": "application/json"}
+        if len(body_bytes) >= GZIP_MIN_BYTES:
+            compressed = gzip.compress(body_bytes, compresslevel=1)
+            if len(compressed) < len(body_bytes) * 0.9:
+                body_bytes = compressed
+                headers["Content-Encoding"] = "gzip"
+        
+        try:
+            response = await self.http_client.post(url, content=body_bytes, headers=headers)
+            response.raise_for_status()
+            result = response.json()
+            return str(result.get("id", ""))
         
-        raise Exception("Failed to create review after retries")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 422:
+                raise ValueError(f"Invalid review data: {e.response.text}")
+            raise
     
+    @_retry_post_on_rate_limit
     async def create_issue_comment(
         self,
         repo: str,
@@ -341,29 +532,19 @@ class GitHubClient:
         
         payload = {"body": body}
         
-        retry_count = 0
-        while retry_count < 3:
-            try:
-                response = await self.http_client.post(url, json=payload)
-                
-                if response.status_code == 429:
-                    self._handle_rate_limit(retry_count)
-                    retry_count += 1
-                    continue
-                
-                response.raise_for_status()
-                result = response.json()
-                return str(result.get("id", ""))
-            
-            except httpx.HTTPStatusError as e:
-                logger.error("create_comment_failed", status=e.response.status_code, error=str(e))
-                raise
+        try:
+            response = await self.http_client.post(url, json=payload, headers=await self._request_headers(repo))
+            response.raise_for_status()
+            result = response.json()
+            return str(result.get("id", ""))
         
-        raise Exception("Failed to create comment after retries")
+        except httpx.HTTPStatusError as e:
+            logger.error("create_comment_failed", status=e.response.status_code, error=str(e))
+            raise
     
     async def get_installation_token(self, installation_id: int) -> str:
         """
-        Get installation access token for GitHub App (Phase 10).
+        Get installation access token for GitHub App.
         
         Args:
             installation_id: GitHub App installation ID
@@ -371,14 +552,13 @@ class GitHubClient:
         Returns:
             Installation access token
             
-        Note:
-            This is a placeholder for Phase 10 GitHub App integration.
-            Currently raises NotImplementedError.
+        Raises:
+            ValueError: If the client is not in app mode
         """
-        raise NotImplementedError(
-            "GitHub App authentication will be implemented in Phase 10. "
-            "Currently using Personal Access Token authentication."
-        )
+        if not self.app_auth:
+            raise ValueError("Installation tokens require auth_mode='app'")
+        
+        return await self.app_auth.get_installation_token(installation_id)
     
     def check_rate_limit(self) -> Dict[str, int]:
         """
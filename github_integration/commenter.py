@@ -4,12 +4,80 @@ GitHubCommenter - Post senior-dev-style inline comments to GitHub PRs
 Formats and posts code review comments with severity indicators.
 """
 
-from typing import Dict, Any, List, Optional
+import asyncio
+import operator
+import os
+import re
+from typing import Dict, Any, List, Optional, Tuple
 import structlog
-from datetime import datetime
 from data.models import GitHubReview, InlineComment
+from tools.diff_parser import DiffParser
 from .client import GitHubClient
 
+logger = structlog.get_logger()
+
+# Severity keyword -> emoji prefix (first keyword in the body wins)
+_SEVERITY_RE = re.compile(r"CRITICAL|HIGH|MEDIUM|LOW", re.IGNORECASE)
+_SEVERITY_PREFIXES = {
+    "CRITICAL": "🔴 ",
+    "HIGH": "🟡 ",
+    "MEDIUM": "🟠 ",
+    "LOW": "🟢 ",
+}
+_DEFAULT_PREFIX = "💡 "
+
+# Review state -> GitHub review event / summary status emoji
+# (REQUEST_CHANGES is the spelling the format task asks for; REQUESTED_CHANGES
+# is kept for older outputs)
+_STATE_TO_EVENT = {
+    "APPROVED": "APPROVE",
+    "REQUEST_CHANGES": "REQUEST_CHANGES",
+    "REQUESTED_CHANGES": "REQUEST_CHANGES",
+}
+_STATE_TO_EMOJI = {
+    "APPROVED": "✅",
+    "REQUEST_CHANGES": "❌",
+    "REQUESTED_CHANGES": "❌",
+}
+_DEFAULT_STATE_EMOJI = "⚠️"
+
+# Inline comments per review; larger reviews are split into several reviews
+# spaced out to stay under GitHub's secondary rate limits
+REVIEW_BATCH_SIZE = max(int(os.getenv("REVIEW_BATCH_SIZE", "40")), 1)
+REVIEW_BATCH_DELAY_MS = int(os.getenv("REVIEW_BATCH_DELAY_MS", "5000"))
+
+# Comment field -> accepted keys, in lookup order (findings use either naming)
+_ALIASES = {
+    "path": ("file_path", "path"),
+    "line": ("line_number", "line"),
+    "body": ("comment", "body"),
+}
+
+
+def _prefix_severity(body: str) -> str:
+    """Prefix a comment body with the emoji for the first severity keyword it mentions."""
+    match = _SEVERITY_RE.search(body)
+    prefix = _SEVERITY_PREFIXES[match.group(0).upper()] if match else _DEFAULT_PREFIX
+    return prefix + body
+
+
+# (path, line, body) in one C-level call; GitHubReview fills in all three keys
+_inline_comment_fields = operator.itemgetter("file_path", "line_number", "comment")
+
+
+def _pick(obj: Any, keys: tuple, default: Any = None) -> Any:
+    """Return the first non-None value among `keys` from a dict or object."""
+    if isinstance(obj, dict):
+        for key in keys:
+            val = obj.get(key)
+            if val is not None:
+                return val
+    else:
+        for key in keys:
+            val = getattr(obj, key, None)
+            if val is not None:
+                return val
+    return default
 
 class GitHubCommenter:
     """Post code review comments to GitHub PRs."""
@@ -33,81 +101,25 @@ class GitHubCommenter:
         Returns:
             Formatted comment with emoji prefix
         """
-        body = comment.get("body", "")
-        
-        # Add severity emoji based on keywords
-        if "CRITICAL" in body.upper():
-            return f"🔴 {body}"
-        elif "HIGH" in body.upper():
-            return f"🟡 {body}"
-        elif "MEDIUM" in body.upper():
-            return f"🟠 {body}"
-        elif "LOW" in body.upper():
-            return f"🟢 {body}"
-        else:
-            return f"💡 {body}"
-    
-    def _convert_line_to_position(
-        self,
-        file_path: str,
-        line_number: int,
-        pr_files: List[Any]
-    ) -> int:
-        """
-        Convert absolute line number to diff position.
-        
-        GitHub API requires 'position' in the diff, not absolute line number.
-        This is a simplified implementation - production would parse the diff.
-        
-        Args:
-            file_path: Path to file
-            line_number: Absolute line number
-            pr_files: List of PR file objects
-            
-        Returns:
-            Diff position (for now, returns line_number as approximation)
-        """
-        # TODO: Implement proper diff position calculation
-        # For Phase 8, we'll use line number as position
-        # Phase 9 will implement proper diff parsing
-        return line_number
+        return _prefix_severity(comment.get("body", ""))
     
     def _format_summary(self, github_review: GitHubReview) -> str:
         """Format the high-level summary for the review."""
         review_state = getattr(github_review, "review_state", "COMMENTED")
-        status_emoji = "✅" if review_state == "APPROVED" else "⚠️"
-        if review_state == "REQUESTED_CHANGES":
-            status_emoji = "❌"
-            
+        status_emoji = _STATE_TO_EMOJI.get(review_state, _DEFAULT_STATE_EMOJI)
+        
         summary_text = getattr(github_review, "summary_comment", "Review completed check findings below.")
         return f"## 🤖 AI Code Review Summary {status_emoji}\n\n{summary_text}\n\n---\n*Sent by CrewAI Lead Engineer*"
 
     def _format_comment(self, comment: Any) -> Dict[str, Any]:
         """Format an individual inline comment for the GitHub API."""
         # Handle both object and dict access for robustness
-        def safe_get(obj, attr, default=""):
-            if isinstance(obj, dict):
-                val = obj.get(attr)
-            else:
-                val = getattr(obj, attr, None)
-            
-            # If value is None, try aliases
-            if val is None:
-                if attr == "file_path": val = safe_get(obj, "path", None)
-                if attr == "path": val = safe_get(obj, "file_path", None)
-                if attr == "line_number": val = safe_get(obj, "line", None)
-                if attr == "line": val = safe_get(obj, "line_number", None)
-                if attr == "comment": val = safe_get(obj, "body", None)
-                if attr == "body": val = safe_get(obj, "comment", None)
-                
-            return val if val is not None else default
-
-        body = safe_get(comment, "comment", safe_get(comment, "body", ""))
+        body = _pick(comment, _ALIASES["body"], "")
         # Add severity prefix if not present
-        formatted_body = self._format_comment_body({"body": body})
+        formatted_body = _prefix_severity(body)
         
-        path = safe_get(comment, "file_path", safe_get(comment, "path", "unknown"))
-        line = safe_get(comment, "line_number", safe_get(comment, "line", 0))
+        path = _pick(comment, _ALIASES["path"], "unknown")
+        line = _pick(comment, _ALIASES["line"], 0)
         
         return {
             "path": str(path) if path else "unknown",
@@ -115,58 +127,43 @@ class GitHubCommenter:
             "body": formatted_body
         }
 
-    async def post_review(
+    def _prepare_inline_comments(
         self,
-        repo_full_name: str,
-        pr_number: int,
-        github_review: GitHubReview,
-        valid_paths: Optional[List[str]] = None,
-        event: str = "COMMENT",
-        diff_content: str = ""
-    ) -> str:
+        inline_comments: List[InlineComment],
+        valid_paths: Optional[List[str]],
+        diff_content: str
+    ) -> Tuple[List[Dict[str, Any]], List[InlineComment]]:
         """
-        Post a complete code review to GitHub PR.
+        Split inline comments into postable comments and mislocated findings.
         
         Args:
-            repo_full_name: Full repo name (owner/repo)
-            pr_number: PR number
-            github_review: GitHubReview object from CrewAI pipeline
+            inline_comments: Comments from the GitHubReview
             valid_paths: List of allowed file paths
-            event: GitHub review event (COMMENT, REQUEST_CHANGES, APPROVE)
             diff_content: Raw diff content for line validation
             
         Returns:
-            Review ID
+            Tuple of (formatted API comments, findings to move to the summary)
         """
-        # 1. Setup line validation if diff is provided
-        from tools.diff_parser import DiffParser
-        parser = DiffParser()
-        changed_lines_cache = {}
-
-        # 2. Format the summary (we'll append validation warnings here if any)
-        summary_base = self._format_summary(github_review)
-        mislocated_findings = []
+        # Setup line validation if diff is provided (diff is parsed once for all files)
+        changed_lines_by_file = DiffParser().get_all_changed_lines(diff_content) if diff_content else {}
+        valid_path_set = frozenset(valid_paths) if valid_paths is not None else None
         
-        # 3. Format inline comments
         formatted_comments = []
-        for comment in github_review.inline_comments:
-            path = getattr(comment, "file_path", getattr(comment, "path", ""))
-            line = getattr(comment, "line_number", getattr(comment, "line", 0))
+        mislocated_findings = []
+        for comment in inline_comments:
+            path, line, _ = _inline_comment_fields(comment)
             
             # Filter comments for files that actually exist in the diff
-            if valid_paths is not None and path not in valid_paths:
-                print(f"⚠️ Skipping comment for invalid path: {path}")
+            if valid_path_set is not None and path not in valid_path_set:
+                logger.debug("skipping_invalid_path", path=path)
                 mislocated_findings.append(comment)
                 continue
             
             # Line validation if diff available
             if diff_content:
-                if path not in changed_lines_cache:
-                    changed_lines_cache[path] = parser.get_changed_lines(diff_content, path)
-                
-                valid_lines = changed_lines_cache[path]
+                valid_lines = changed_lines_by_file.get(path, frozenset())
                 if int(line) not in valid_lines:
-                    print(f"⚠️ Line {line} not in diff for {path}. Moving to summary.")
+                    logger.debug("line_not_in_diff", path=path, line=line)
                     mislocated_findings.append(comment)
                     continue
                 
@@ -175,49 +172,111 @@ class GitHubCommenter:
             formatted_comment["side"] = "RIGHT"
             formatted_comments.append(formatted_comment)
         
-        # 4. Handle mislocated findings (add to summary)
+        return formatted_comments, mislocated_findings
+
+    async def post_review(
+        self,
+        repo_full_name: str,
+        pr_number: int,
+        github_review: GitHubReview,
+        valid_paths: Optional[List[str]] = None,
+        event: str = "COMMENT",
+        diff_content: str = ""
+    ) -> str:
+        """
+        Post a complete code review to GitHub PR.
+        
+        Args:
+            repo_full_name: Full repo name (owner/repo)
+            pr_number: PR number
+            github_review: GitHubReview object from CrewAI pipeline
+            valid_paths: List of allowed file paths
+            event: GitHub review event (COMMENT, REQUEST_CHANGES, APPROVE)
+            diff_content: Raw diff content for line validation
+            
+        Returns:
+            Review ID
+        """
+        log = logger.bind(repo=repo_full_name, pr=pr_number)
+        
+        # 1. Format the summary (we'll append validation warnings here if any)
+        summary_parts = [self._format_summary(github_review)]
+        
+        # 2. Validate and format inline comments (summary-only reviews skip this entirely)
+        if github_review.inline_comments:
+            formatted_comments, mislocated_findings = self._prepare_inline_comments(
+                github_review.inline_comments,
+                valid_paths,
+                diff_content
+            )
+        else:
+            formatted_comments, mislocated_findings = [], []
+        
+        # 3. Handle mislocated findings (add to summary)
         if mislocated_findings:
-            summary_base += "\n\n### 📋 Additional Findings (General/Context)\n"
+            summary_parts.append("\n\n### 📋 Additional Findings (General/Context)\n")
             for f in mislocated_findings:
-                path = getattr(f, "file_path", getattr(f, "path", "unknown"))
-                line = getattr(f, "line_number", getattr(f, "line", "?"))
-                body = getattr(f, "comment", getattr(f, "body", ""))
-                summary_base += f"- **{path}:L{line}**: {body}\n"
+                path, line, body = _inline_comment_fields(f)
+                summary_parts.append(f"- **{path}:L{line}**: {body}\n")
+        
+        # Pre-existing findings ride along in the same review body (one API call)
+        if github_review.pre_existing_findings:
+            summary_parts.append("\n\n")
+            summary_parts.append(self._format_pre_existing_findings(github_review.pre_existing_findings))
+        
+        summary_base = "".join(summary_parts)
 
-        # 5. Post review via GitHub API
+        # 4. Post review via GitHub API
+        # Determine correct event (override 'COMMENT' if results are critical)
+        event = _STATE_TO_EVENT.get(github_review.review_state, event)
+        
+        # First batch carries the summary and verdict; the rest are plain comments
+        batches = [
+            formatted_comments[i:i + REVIEW_BATCH_SIZE]
+            for i in range(0, len(formatted_comments), REVIEW_BATCH_SIZE)
+        ] or [[]]
+        
         try:
-            # Determine correct event (override 'COMMENT' if results are critical)
-            if github_review.review_state == "REQUESTED_CHANGES":
-                event = "REQUEST_CHANGES"
-            elif github_review.review_state == "APPROVED":
-                event = "APPROVE"
-
             review_id = await self.client.create_review(
                 repo=repo_full_name,
                 pr_number=pr_number,
                 body=summary_base,
                 event=event,
-                comments=formatted_comments
+                comments=batches[0]
             )
-            
-            print(f"✅ Posted review to {repo_full_name}#{pr_number} (Review ID: {review_id})")
-            
-            # 6. Post pre-existing findings as a separate comment (if any)
-            if github_review.pre_existing_findings:
-                await self._post_pre_existing_findings(repo_full_name, pr_number, github_review.pre_existing_findings)
-            
-            return str(review_id)
         
         except Exception as e:
             # Handle 422 "line not in diff" errors by falling back to PR comment
+            # (nothing has been posted yet, so the whole review goes there)
             error_str = str(e)
             if "422" in error_str or "Unprocessable Entity" in error_str:
-                print(f"⚠️ Inline comments failed (422) even after validation. Reason: {error_str}")
-                print(f"⚠️ Falling back to single PR comment.")
-                return await self._post_as_pr_comment(repo_full_name, pr_number, github_review)
+                log.warning("inline_comments_rejected_falling_back", error=error_str)
+                return await self._post_as_pr_comment(repo_full_name, pr_number, github_review, log=log)
             else:
-                print(f"❌ Failed to post review: {e}")
+                log.error("review_post_failed", error=error_str)
                 raise
+        
+        for part, batch in enumerate(batches[1:], 2):
+            await asyncio.sleep(REVIEW_BATCH_DELAY_MS / 1000)
+            try:
+                await self.client.create_review(
+                    repo=repo_full_name,
+                    pr_number=pr_number,
+                    body=f"AI review continued ({part}/{len(batches)})",
+                    event="COMMENT",
+                    comments=batch
+                )
+            except Exception as e:
+                # The summary and earlier batches are already on the PR; only
+                # the comments not posted yet go into the fallback comment
+                log.warning("review_batch_rejected", part=part, batches=len(batches), error=str(e))
+                remaining = [c for b in batches[part - 1:] for c in b]
+                await self._post_remaining_comments(repo_full_name, pr_number, remaining, log=log)
+                break
+        
+        log.info("review_posted", review_id=review_id, batches=len(batches))
+        
+        return str(review_id)
     
     def format_review_preview(self, github_review: GitHubReview) -> str:
         """
@@ -249,10 +308,10 @@ class GitHubCommenter:
         lines.append("-" * 60)
         
         for i, comment in enumerate(github_review.inline_comments, 1):
-            path = comment.get("path", "unknown")
-            line = comment.get("line", 0)
-            body = comment.get("body", "")
-            formatted_body = self._format_comment_body(comment)
+            path = _pick(comment, _ALIASES["path"], "unknown")
+            line = _pick(comment, _ALIASES["line"], 0)
+            body = _pick(comment, _ALIASES["body"], "")
+            formatted_body = _prefix_severity(body)
             
             lines.append(f"{i}. {path}:L{line}")
             lines.append(f"   {formatted_body}")
@@ -266,7 +325,8 @@ class GitHubCommenter:
         self,
         repo_full_name: str,
         pr_number: int,
-        github_review: GitHubReview
+        github_review: GitHubReview,
+        log: Optional[Any] = None
     ) -> str:
         """
         Fallback: Post review as single PR comment when inline comments fail.
@@ -277,34 +337,35 @@ class GitHubCommenter:
             repo_full_name: Full repo name (owner/repo)
             pr_number: PR number
             github_review: GitHubReview object
+            log: Logger already bound to repo/pr (bound here if omitted)
             
         Returns:
             Comment ID
         """
+        log = log or logger.bind(repo=repo_full_name, pr=pr_number)
+        
         # Format all findings as single comment
-        comment_body = f"""## 🤖 AI Code Review Summary
-
-{github_review.summary_comment}
-
-### 📋 Findings ({len(github_review.inline_comments)}):
-
-"""
+        parts = [
+            "## 🤖 AI Code Review Summary\n\n",
+            github_review.summary_comment,
+            f"\n\n### 📋 Findings ({len(github_review.inline_comments)}):\n\n",
+        ]
         
         for i, comment in enumerate(github_review.inline_comments, 1):
-            # Safe access helper
-            def safe_val(obj, attr, default):
-                if isinstance(obj, dict): return obj.get(attr, default)
-                return getattr(obj, attr, default)
-
-            path = safe_val(comment, "file_path", safe_val(comment, "path", "unknown"))
-            line = safe_val(comment, "line_number", safe_val(comment, "line", 1))
-            body = safe_val(comment, "comment", safe_val(comment, "body", ""))
+            path = _pick(comment, _ALIASES["path"], "unknown")
+            line = _pick(comment, _ALIASES["line"], 1)
+            body = _pick(comment, _ALIASES["body"], "")
             
-            formatted_body = self._format_comment_body({"body": body})
+            formatted_body = _prefix_severity(body)
             
-            comment_body += f"{i}. **`{path}:L{line}`** - {formatted_body}\n"
+            parts.append(f"{i}. **`{path}:L{line}`** - {formatted_body}\n")
         
-        comment_body += "\n---\n*Posted as single comment due to diff position conflicts*\n"
+        if github_review.pre_existing_findings:
+            parts.append("\n")
+            parts.append(self._format_pre_existing_findings(github_review.pre_existing_findings))
+        
+        parts.append("\n---\n*Posted as single comment due to diff position conflicts*\n")
+        comment_body = "".join(parts)
         
         # Post as issue comment
         comment_id = await self.client.create_issue_comment(
@@ -313,54 +374,69 @@ class GitHubCommenter:
             body=comment_body
         )
         
-        print(f"✅ Posted fallback comment to {repo_full_name}#{pr_number} (Comment ID: {comment_id})")
+        log.info("fallback_comment_posted", comment_id=comment_id)
         return str(comment_id)
     
-    async def _post_pre_existing_findings(
+    async def _post_remaining_comments(
         self,
         repo_full_name: str,
         pr_number: int,
-        findings: List[InlineComment]
+        comments: List[Dict[str, Any]],
+        log: Optional[Any] = None
     ) -> str:
         """
-        Post pre-existing findings as a separate PR comment.
+        Post inline comments from rejected continuation batches as one PR comment.
         
         Args:
             repo_full_name: Full repo name (owner/repo)
             pr_number: PR number
-            findings: List of findings on unchanged lines
+            comments: Formatted API comments (path, line, body) not yet posted
+            log: Logger already bound to repo/pr (bound here if omitted)
             
         Returns:
             Comment ID
         """
-        if not findings:
-            return ""
+        log = log or logger.bind(repo=repo_full_name, pr=pr_number)
         
-        # Build comment body
-        comment_body = "## 📋 Pre-existing Issues Found\n\n"
-        comment_body += f"While reviewing this PR, I also noticed **{len(findings)} existing issue(s)** in the files you modified:\n\n"
-        
-        for i, finding in enumerate(findings, 1):
-            def safe_val(obj, attr, default):
-                if isinstance(obj, dict): return obj.get(attr, default)
-                return getattr(obj, attr, default)
-
-            path = safe_val(finding, "file_path", safe_val(finding, "path", "unknown"))
-            line = safe_val(finding, "line_number", safe_val(finding, "line", 1))
-            body = safe_val(finding, "comment", safe_val(finding, "body", ""))
-            
-            comment_body += f"{i}. **`{path}:L{line}`**\n   {body}\n\n"
-        
-        comment_body += "---\n"
-        comment_body += "> 💡 **Note**: These issues existed before this PR and are not blocking approval. "
-        comment_body += "However, consider addressing them in a follow-up PR to improve overall code quality.\n"
+        items = "".join(
+            f"{i}. **`{c['path']}:L{c['line']}`** - {c['body']}\n"
+            for i, c in enumerate(comments, 1)
+        )
+        comment_body = (
+            f"## 🤖 AI Code Review (continued)\n\n### 📋 Remaining Findings ({len(comments)}):\n\n"
+            f"{items}"
+            "\n---\n*Posted as single comment due to diff position conflicts*\n"
+        )
         
-        # Post as issue comment
         comment_id = await self.client.create_issue_comment(
             repo=repo_full_name,
             pr_number=pr_number,
             body=comment_body
         )
         
-        print(f"📋 Posted {len(findings)} pre-existing findings to {repo_full_name}#{pr_number} (Comment ID: {comment_id})")
+        log.info("remaining_comments_posted", count=len(comments), comment_id=comment_id)
         return str(comment_id)
+    
+    def _format_pre_existing_findings(self, findings: List[InlineComment]) -> str:
+        """
+        Format pre-existing findings as a markdown section.
+        
+        Args:
+            findings: List of findings on unchanged lines
+            
+        Returns:
+            Markdown section listing the findings
+        """
+        items = "".join(
+            f"{i}. **`{path}:L{line}`**\n   {body}\n\n"
+            for i, (path, line, body) in enumerate(map(_inline_comment_fields, findings), 1)
+        )
+        
+        return (
+            "## 📋 Pre-existing Issues Found\n\n"
+            f"While reviewing this PR, I also noticed **{len(findings)} existing issue(s)** in the files you modified:\n\n"
+            f"{items}"
+            "---\n"
+            "> 💡 **Note**: These issues existed before this PR and are not blocking approval. "
+            "However, consider addressing them in a follow-up PR to improve overall code quality.\n"
+        )
@@ -4,9 +4,12 @@ Installation Management
 Manages GitHub App installations and repository access.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, TYPE_CHECKING
 import structlog
 
+if TYPE_CHECKING:
+    from config.app_config import GitHubAppConfig
+
 logger = structlog.get_logger()
 
 
@@ -22,8 +25,26 @@ class InstallationManager:
         # In-memory cache: repo_full_name -> installation_id
         self._installation_cache: Dict[str, int] = {}
         
-        # Reverse cache: installation_id -> list[repo_full_name]
-        self._repos_cache: Dict[int, List[str]] = {}
+        # Reverse cache: installation_id -> set[repo_full_name]
+        self._repos_cache: Dict[int, Set[str]] = {}
+        
+        # App config, loaded from the environment on first lookup
+        self._config: Optional["GitHubAppConfig"] = None
+    
+    def _get_config(self) -> "GitHubAppConfig":
+        """
+        Load GitHub App config once and reuse it for later lookups.
+        
+        Returns:
+            GitHubAppConfig instance
+            
+        Raises:
+            ValueError: If required environment variables are missing
+        """
+        if self._config is None:
+            from config.app_config import GitHubAppConfig
+            self._config = GitHubAppConfig.from_env()
+        return self._config
     
     async def get_installation_id(self, repo_full_name: str) -> Optional[int]:
         """
@@ -52,10 +73,8 @@ class InstallationManager:
         
         # For Phase 10, we use a single installation ID from config
         # Phase 11+ will implement multi-installation support via GitHub API
-        from config.app_config import GitHubAppConfig
-        
         try:
-            config = GitHubAppConfig.from_env()
+            config = self._get_config()
             if config.installation_id:
                 # Cache the mapping
                 self._cache_installation(repo_full_name, config.installation_id)
@@ -92,7 +111,7 @@ class InstallationManager:
                 installation_id=installation_id,
                 count=len(self._repos_cache[installation_id])
             )
-            return self._repos_cache[installation_id]
+            return list(self._repos_cache[installation_id])
         
         # For Phase 10, return empty list
         # Phase 11+ will implement via GitHub API
@@ -115,11 +134,7 @@ class InstallationManager:
         self._installation_cache[repo_full_name] = installation_id
         
         # Update reverse cache
-        if installation_id not in self._repos_cache:
-            self._repos_cache[installation_id] = []
-        
-        if repo_full_name not in self._repos_cache[installation_id]:
-            self._repos_cache[installation_id].append(repo_full_name)
+        self._repos_cache.setdefault(installation_id, set()).add(repo_full_name)
         
         logger.debug(
             "installation_cached",
@@ -4,29 +4,20 @@ MockPRData - Testing without real GitHub API calls
 Provides realistic mock data for unit tests and local development.
 """
 
+from dataclasses import replace
+from functools import lru_cache
 from typing import List
 from .pr_fetcher import PRData, FileChange
 from tasks.format_comments_task import GitHubReview
 
 
-class MockPRData:
-    """Mock GitHub PR data for testing."""
-    
-    @staticmethod
-    def get_sample_pr(pr_number: int = 123) -> PRData:
-        """
-        Get a realistic sample PR with intentional code issues.
-        
-        Args:
-            pr_number: PR number to use
-            
-        Returns:
-            PRData with 3 files containing various code smells
-        """
-        # File 1: Python with security issue
-        file1 = FileChange(
-            filename="app/auth.py",
-            patch="""@@ -1,10 +1,15 @@
+# Sample objects are built (and the review validated) once at import and
+# handed out as copies.
+
+# File 1: Python with security issue
+_SAMPLE_FILE1 = FileChange(
+    filename="app/auth.py",
+    patch="""@@ -1,10 +1,15 @@
  import os
 +import requests
  
@@ -43,16 +34,16 @@ class MockPRData:
 +    )
 +    return response.status_code == 200
 """,
-            language="python",
-            additions=10,
-            deletions=2,
-            status="modified"
-        )
-        
-        # File 2: JavaScript with performance issue
-        file2 = FileChange(
-            filename="frontend/utils.js",
-            patch="""@@ -5,8 +5,18 @@
+    language="python",
+    additions=10,
+    deletions=2,
+    status="modified"
+)
+
+# File 2: JavaScript with performance issue
+_SAMPLE_FILE2 = FileChange(
+    filename="frontend/utils.js",
+    patch="""@@ -5,8 +5,18 @@
  
  function findUserById(users, targetId) {
 -    return users.find(user => user.id === targetId);
@@ -67,16 +58,16 @@ class MockPRData:
 +    return null;
  }
 """,
-            language="javascript",
-            additions=10,
-            deletions=1,
-            status="modified"
-        )
-        
-        # File 3: Python with code smell
-        file3 = FileChange(
-            filename="services/user_service.py",
-            patch="""@@ -1,5 +1,25 @@
+    language="javascript",
+    additions=10,
+    deletions=1,
+    status="modified"
+)
+
+# File 3: Python with code smell
+_SAMPLE_FILE3 = FileChange(
+    filename="services/user_service.py",
+    patch="""@@ -1,5 +1,25 @@
  class UserService:
 -    def get_user(self, user_id):
 -        pass
@@ -101,43 +92,92 @@ class MockPRData:
 +    def check_permissions(self, user_id):
 +        pass
 """,
-            language="python",
-            additions=20,
-            deletions=2,
-            status="modified"
-        )
-        
-        # Combine files
-        files_changed = [file1, file2, file3]
-        
-        # Create full diff
-        full_diff = f"""diff --git a/app/auth.py b/app/auth.py
+    language="python",
+    additions=20,
+    deletions=2,
+    status="modified"
+)
+
+_SAMPLE_FILES = (_SAMPLE_FILE1, _SAMPLE_FILE2, _SAMPLE_FILE3)
+
+_SAMPLE_FULL_DIFF = f"""diff --git a/app/auth.py b/app/auth.py
 --- a/app/auth.py
 +++ b/app/auth.py
-{file1.patch}
+{_SAMPLE_FILE1.patch}
 
 diff --git a/frontend/utils.js b/frontend/utils.js
 --- a/frontend/utils.js
 +++ b/frontend/utils.js
-{file2.patch}
+{_SAMPLE_FILE2.patch}
 
 diff --git a/services/user_service.py b/services/user_service.py
 --- a/services/user_service.py
 +++ b/services/user_service.py
-{file3.patch}
+{_SAMPLE_FILE3.patch}
 """
+
+_SAMPLE_PR_TEMPLATE = PRData(
+    repo_name="test-org/test-repo",
+    pr_number=123,
+    pr_url="https://github.com/test-org/test-repo/pull/123",
+    title="Add user authentication and utilities",
+    author="test-developer",
+    files_changed=list(_SAMPLE_FILES),
+    full_diff=_SAMPLE_FULL_DIFF
+)
+
+
+_SAMPLE_REVIEW = GitHubReview(
+    inline_comments=[
+        {
+            "file_path": "app/auth.py",
+            "line_number": 6,
+            "comment": "CRITICAL: Hardcoded API key 'sk-1234567890abcdef' detected on line 6. This is a security vulnerability. Move secrets to environment variables using python-dotenv or a secrets manager."
+        },
+        {
+            "file_path": "frontend/utils.js",
+            "line_number": 9,
+            "comment": "HIGH: O(n²) time complexity detected in nested loops (lines 9-14). Replace with Array.find() or use a Map for O(n) lookup performance."
+        },
+        {
+            "file_path": "services/user_service.py",
+            "line_number": 4,
+            "comment": "MEDIUM: Single Responsibility Principle violation. UserService has too many responsibilities (database, email, logging, analytics, permissions). Extract these into separate service classes."
+        }
+    ],
+    summary_comment="""Found 3 issues requiring attention:
+- 1 CRITICAL security issue (hardcoded credentials)
+- 1 HIGH performance issue (O(n²) complexity)
+- 1 MEDIUM design issue (SRP violation)
+
+Please address the critical security issue before merging.""",
+    review_state="REQUESTED_CHANGES"
+)
+
+
+class MockPRData:
+    """Mock GitHub PR data for testing."""
+    
+    @staticmethod
+    def get_sample_pr(pr_number: int = 123) -> PRData:
+        """
+        Get a realistic sample PR with intentional code issues.
         
-        return PRData(
-            repo_name="test-org/test-repo",
+        Args:
+            pr_number: PR number to use
+            
+        Returns:
+            PRData with 3 files containing various code smells
+        """
+        return replace(
+            _SAMPLE_PR_TEMPLATE,
             pr_number=pr_number,
             pr_url=f"https://github.com/test-org/test-repo/pull/{pr_number}",
-            title="Add user authentication and utilities",
-            author="test-developer",
-            files_changed=files_changed,
-            full_diff=full_diff
+            files_changed=list(_SAMPLE_FILES)
         )
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_flawed_pr_diff() -> str:
         """
         Get a diff with multiple intentional flaws for testing.
@@ -213,29 +253,4 @@ diff --git a/services/user_service.py b/services/user_service.py
         Returns:
             GitHubReview with inline comments and summary
         """
-        return GitHubReview(
-            inline_comments=[
-                {
-                    "path": "app/auth.py",
-                    "line": "6",
-                    "body": "CRITICAL: Hardcoded API key 'sk-1234567890abcdef' detected on line 6. This is a security vulnerability. Move secrets to environment variables using python-dotenv or a secrets manager."
-                },
-                {
-                    "path": "frontend/utils.js",
-                    "line": "9",
-                    "body": "HIGH: O(n²) time complexity detected in nested loops (lines 9-14). Replace with Array.find() or use a Map for O(n) lookup performance."
-                },
-                {
-                    "path": "services/user_service.py",
-                    "line": "4",
-                    "body": "MEDIUM: Single Responsibility Principle violation. UserService has too many responsibilities (database, email, logging, analytics, permissions). Extract these into separate service classes."
-                }
-            ],
-            summary_comment="""Found 3 issues requiring attention:
-- 1 CRITICAL security issue (hardcoded credentials)
-- 1 HIGH performance issue (O(n²) complexity)
-- 1 MEDIUM design issue (SRP violation)
-
-Please address the critical security issue before merging.""",
-            review_state="REQUESTED_CHANGES"
-        )
+        return _SAMPLE_REVIEW.model_copy(deep=True)
@@ -5,14 +5,51 @@ Fetches PR metadata, changed files, and unified diffs from GitHub API.
 Compatible with Phase 3 DiffParser.
 """
 
+import asyncio
+import io
 import os
-from typing import List, Optional
-from pydantic import BaseModel, Field
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
 from github.PullRequest import PullRequest
 from .client import GitHubClient
 
 import logging
+import logging.handlers
 import sys
+import threading
+
+# Longest time a buffered log record waits before it is written to disk
+LOG_FLUSH_INTERVAL_SECONDS = 5.0
+
+
+class _TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes a few seconds after the first buffered record."""
+    
+    def __init__(self, *args, flush_interval: float, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.flush_interval = flush_interval
+        self._timer: Optional[threading.Timer] = None
+    
+    def emit(self, record: logging.LogRecord):
+        super().emit(record)
+        # Records still buffered (quiet period) are written by the timer
+        if self.buffer and self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def flush(self):
+        self.acquire()
+        try:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            super().flush()
+        finally:
+            self.release()
+
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -23,10 +60,17 @@ if not logger.handlers:
     # Create logs directory if it doesn't exist
     os.makedirs('logs', exist_ok=True)
     
-    # File handler
+    # File handler, fed through a memory buffer so records reach disk in batches
+    # (flushed when full, on WARNING and above, LOG_FLUSH_INTERVAL_SECONDS after
+    # the first buffered record, and at interpreter shutdown)
     file_handler = logging.FileHandler('logs/pr_fetcher.log', encoding='utf-8')
     file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-    logger.addHandler(file_handler)
+    logger.addHandler(_TimedMemoryHandler(
+        capacity=1024,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+        flush_interval=LOG_FLUSH_INTERVAL_SECONDS
+    ))
     
     # Stream handler (optional, but good for immediate feedback if needed, 
     # currently relying on file to keep console clean for the main app)
@@ -34,25 +78,102 @@ if not logger.handlers:
     # logger.addHandler(stream_handler)
 
 
-class FileChange(BaseModel):
+# Extension -> language identifier
+_EXT_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'javascript',
+    '.tsx': 'typescript',
+    '.java': 'java',
+    '.cpp': 'cpp',
+    '.c': 'c',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.rb': 'ruby',
+    '.php': 'php',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.scala': 'scala',
+    '.cs': 'csharp',
+    '.html': 'html',
+    '.css': 'css',
+    '.sql': 'sql',
+    '.sh': 'bash',
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+    '.json': 'json',
+    '.xml': 'xml',
+    '.md': 'markdown',
+}
+
+# Extensions of files that never carry a reviewable patch
+_BINARY_EXTS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.svg',
+    '.pdf', '.zip', '.tar', '.gz', '.rar', '.7z',
+    '.exe', '.dll', '.so', '.dylib',
+    '.pyc', '.pyo', '.class', '.jar',
+    '.woff', '.woff2', '.ttf', '.eot',
+    '.mp3', '.mp4', '.avi', '.mov', '.wav',
+})
+
+
+# Fetched PRs are reused for this long when the head commit is unchanged
+# (duplicate/rapid webhook deliveries), keeping at most this many entries
+PR_CACHE_TTL_SECONDS = 60
+PR_CACHE_MAX_ENTRIES = 128
+
+# Per-file chunk of the combined diff (headers + patch)
+_DIFF_HDR = "diff --git a/{fn} b/{fn}\n--- a/{fn}\n+++ b/{fn}\n{p}\n"
+
+
+def _extension(filename: str) -> str:
+    """Lowercased extension of the basename (same rules as os.path.splitext)."""
+    dot = filename.rfind('.')
+    slash = filename.rfind('/')
+    if dot <= slash + 1:
+        return ''
+    # Leading dots (".env", "..a") mark hidden files, not extensions
+    if filename[slash + 1] == '.' and not filename[slash + 1:dot].strip('.'):
+        return ''
+    return filename[dot:].lower()
+
+
+def _classify(filename: str) -> Tuple[str, bool]:
+    """(language, is_binary) from a single extension extraction."""
+    ext = _extension(filename)
+    return _EXT_MAP.get(ext, 'unknown'), ext in _BINARY_EXTS
+
+
+@dataclass(slots=True, frozen=True)
+class FileChange:
     """Represents a single file changed in a PR."""
-    filename: str = Field(description="Path to the file")
-    patch: str = Field(description="Unified diff patch for this file")
-    language: str = Field(description="Programming language (py, js, java, etc.)")
-    additions: int = Field(description="Number of lines added")
-    deletions: int = Field(description="Number of lines deleted")
-    status: str = Field(description="Change status (added, modified, removed, renamed)")
+    filename: str  # Path to the file
+    patch: str  # Unified diff patch for this file
+    language: str  # Programming language (python, javascript, etc.)
+    additions: int  # Number of lines added
+    deletions: int  # Number of lines deleted
+    status: str  # Change status (added, modified, removed, renamed)
+    
+    def model_dump(self) -> Dict[str, Any]:
+        """Plain-dict view, as the former Pydantic model provided."""
+        return asdict(self)
 
 
-class PRData(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PRData:
     """Complete PR data for review analysis."""
-    repo_name: str = Field(description="Full repository name (owner/repo)")
-    pr_number: int = Field(description="Pull request number")
-    pr_url: str = Field(description="GitHub PR URL")
-    title: str = Field(description="PR title")
-    author: str = Field(description="PR author username")
-    files_changed: List[FileChange] = Field(description="List of changed files with diffs")
-    full_diff: str = Field(description="Complete unified diff for all files")
+    repo_name: str  # Full repository name (owner/repo)
+    pr_number: int  # Pull request number
+    pr_url: str  # GitHub PR URL
+    title: str  # PR title
+    author: str  # PR author username
+    files_changed: List[FileChange]  # Changed files with diffs
+    full_diff: str  # Complete unified diff for all files
+    
+    def model_dump(self) -> Dict[str, Any]:
+        """Plain-dict view, as the former Pydantic model provided."""
+        return asdict(self)
 
 
 class PRFetcher:
@@ -66,6 +187,9 @@ class PRFetcher:
             client: GitHubClient instance. If None, creates new client.
         """
         self.client = client or GitHubClient()
+        
+        # (repo, pr_number, head_sha) -> (fetched_at, PRData), oldest first
+        self._pr_cache: "OrderedDict[Tuple[str, int, str], Tuple[float, PRData]]" = OrderedDict()
     
     def _detect_language(self, filename: str) -> str:
         """
@@ -77,37 +201,7 @@ class PRFetcher:
         Returns:
             Language identifier (py, js, java, etc.) or 'unknown'
         """
-        extension_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.jsx': 'javascript',
-            '.tsx': 'typescript',
-            '.java': 'java',
-            '.cpp': 'cpp',
-            '.c': 'c',
-            '.go': 'go',
-            '.rs': 'rust',
-            '.rb': 'ruby',
-            '.php': 'php',
-            '.swift': 'swift',
-            '.kt': 'kotlin',
-            '.scala': 'scala',
-            '.cs': 'csharp',
-            '.html': 'html',
-            '.css': 'css',
-            '.sql': 'sql',
-            '.sh': 'bash',
-            '.yaml': 'yaml',
-            '.yml': 'yaml',
-            '.json': 'json',
-            '.xml': 'xml',
-            '.md': 'markdown',
-        }
-        
-        # Get file extension
-        ext = os.path.splitext(filename)[1].lower()
-        return extension_map.get(ext, 'unknown')
+        return _EXT_MAP.get(_extension(filename), 'unknown')
     
     def _is_binary_file(self, filename: str) -> bool:
         """
@@ -119,35 +213,26 @@ class PRFetcher:
         Returns:
             True if binary file
         """
-        binary_extensions = {
-            '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.svg',
-            '.pdf', '.zip', '.tar', '.gz', '.rar', '.7z',
-            '.exe', '.dll', '.so', '.dylib',
-            '.pyc', '.pyo', '.class', '.jar',
-            '.woff', '.woff2', '.ttf', '.eot',
-            '.mp3', '.mp4', '.avi', '.mov', '.wav',
-        }
-        
-        ext = os.path.splitext(filename)[1].lower()
-        return ext in binary_extensions
-    
-        return False
+        return _extension(filename) in _BINARY_EXTS
 
-    def _should_skip_file(self, file_change, max_lines: int = 50000) -> bool:
+    def _should_skip_file(self, file_change, max_lines: int = 50000, is_binary: Optional[bool] = None) -> bool:
         """
         Determine if file should be skipped.
         
         Args:
             file_change: GitHub file object
             max_lines: Maximum lines to process
+            is_binary: Precomputed binary check from _classify (computed if None)
             
         Returns:
             True if file should be skipped
         """
         filename = file_change.filename
+        if is_binary is None:
+            is_binary = self._is_binary_file(filename)
         
         # Skip binary files
-        if self._is_binary_file(filename):
+        if is_binary:
             logger.info(f"Skipping {filename}: Identified as binary file.")
             return True
         
@@ -188,13 +273,21 @@ class PRFetcher:
         
         owner, repo = parts
         
-        # Get PR object
+        # Get PR object (PyGithub is blocking, and its retries sleep)
         try:
-            pr: PullRequest = self.client.get_pr(owner, repo, pr_number)
+            pr: PullRequest = await asyncio.to_thread(self.client.get_pr, owner, repo, pr_number)
         except Exception as e:
             logger.error(f"Failed to fetch PR {repo_full_name}#{pr_number}: {e}")
             raise
 
+        # Reuse a recent fetch of the same head commit
+        cache_key = (repo_full_name, pr_number, pr.head.sha)
+        cached = self._pr_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < PR_CACHE_TTL_SECONDS:
+            self._pr_cache.move_to_end(cache_key)
+            logger.info(f"Using cached PR data for {repo_full_name}#{pr_number} @ {pr.head.sha[:7]}")
+            return cached[1]
+
         # Extract metadata
         pr_url = pr.html_url
         title = pr.title
@@ -204,21 +297,24 @@ class PRFetcher:
 
         # Fetch all changed files
         files_changed: List[FileChange] = []
-        full_diff_parts: List[str] = []
+        full_diff_buf = io.StringIO()
         
-        files = list(pr.get_files())
-        logger.info(f"Total files found in PR: {len(files)}")
-
-        for file in files:
-            logger.info(f"Processing file: {file.filename} (Status: {file.status}, Additions: {file.additions}, Deletions: {file.deletions})")
+        # Stream the REST listing (100 files/page, later pages fetched concurrently)
+        # so files are processed while the remaining pages are in flight
+        total_files = 0
+        log_each_file = logger.isEnabledFor(logging.DEBUG)
+        async for file in self.client.iter_pr_files(repo_full_name, pr_number):
+            total_files += 1
+            if log_each_file:
+                logger.debug(f"Processing file: {file.filename} (Status: {file.status}, Additions: {file.additions}, Deletions: {file.deletions})")
+            
+            # Detect language and binary-ness in one extension lookup
+            language, is_binary = _classify(file.filename)
             
             # Skip binary/large files
-            if self._should_skip_file(file):
+            if self._should_skip_file(file, is_binary=is_binary):
                 continue
             
-            # Detect language
-            language = self._detect_language(file.filename)
-            
             # Create FileChange object
             file_change = FileChange(
                 filename=file.filename,
@@ -231,17 +327,19 @@ class PRFetcher:
             
             files_changed.append(file_change)
             
-            # Add to full diff
-            full_diff_parts.append(f"diff --git a/{file.filename} b/{file.filename}")
-            full_diff_parts.append(f"--- a/{file.filename}")
-            full_diff_parts.append(f"+++ b/{file.filename}")
-            full_diff_parts.append(file.patch or "")
-            full_diff_parts.append("")  # Empty line between files
+            # Add to full diff (blank line between files)
+            if full_diff_buf.tell():
+                full_diff_buf.write("\n")
+            fn = sys.intern(file.filename)
+            full_diff_buf.write(_DIFF_HDR.format_map({"fn": fn, "p": file.patch or ""}))
         
-        logger.info(f"Successfully processed {len(files_changed)}/{len(files)} files.")
+        logger.info(
+            f"Processed files for {repo_full_name}#{pr_number}: "
+            f"kept {len(files_changed)}, skipped {total_files - len(files_changed)}, total {total_files}"
+        )
 
         # Combine full diff
-        full_diff = "\n".join(full_diff_parts)
+        full_diff = full_diff_buf.getvalue()
         
         # Create PRData
         pr_data = PRData(
@@ -254,4 +352,9 @@ class PRFetcher:
             full_diff=full_diff
         )
         
+        self._pr_cache[cache_key] = (time.monotonic(), pr_data)
+        self._pr_cache.move_to_end(cache_key)
+        if len(self._pr_cache) > PR_CACHE_MAX_ENTRIES:
+            self._pr_cache.popitem(last=False)
+        
         return pr_data
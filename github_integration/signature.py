@@ -7,8 +7,25 @@ to prevent unauthorized requests and replay attacks.
 
 import hmac
 import hashlib
+from functools import lru_cache
 from typing import Optional
 
+# Raw size of an HMAC-SHA256 digest (64 hex characters on the wire)
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+@lru_cache(maxsize=4)
+def _prototype(secret_bytes: bytes) -> "hmac.HMAC":
+    """Keyed HMAC-SHA256 with no data yet; copy() skips the per-call key setup."""
+    return hmac.new(secret_bytes, b"", hashlib.sha256)
+
+
+def _sign(body: bytes, secret: str) -> "hmac.HMAC":
+    """HMAC-SHA256 of body, started from the cached keyed prototype."""
+    mac = _prototype(secret.encode('utf-8')).copy()
+    mac.update(body)
+    return mac
+
 
 def verify_webhook_signature(
     body: bytes,
@@ -50,15 +67,21 @@ def verify_webhook_signature(
     except IndexError:
         return False
     
-    # Compute expected HMAC
-    expected_digest = hmac.new(
-        secret.encode('utf-8'),
-        body,
-        hashlib.sha256
-    ).hexdigest()
+    # Reject malformed digests before hashing the (possibly large) body
+    if len(received_digest) != 2 * _DIGEST_SIZE:
+        return False
+    try:
+        received_bytes = bytes.fromhex(received_digest)
+    except ValueError:
+        return False
+    if len(received_bytes) != _DIGEST_SIZE:
+        return False
+    
+    # Compute expected HMAC as raw bytes (32 bytes instead of 64 hex chars)
+    expected_digest = _sign(body, secret).digest()
     
     # Timing-safe comparison to prevent timing attacks
-    return hmac.compare_digest(expected_digest, received_digest)
+    return hmac.compare_digest(expected_digest, received_bytes)
 
 
 def generate_webhook_signature(body: bytes, secret: str) -> str:
@@ -72,11 +95,7 @@ def generate_webhook_signature(body: bytes, secret: str) -> str:
     Returns:
         Signature in GitHub format: sha256=<hex_digest>
     """
-    digest = hmac.new(
-        secret.encode('utf-8'),
-        body,
-        hashlib.sha256
-    ).hexdigest()
+    digest = _sign(body, secret).hexdigest()
     
     return f"sha256={digest}"
 
@@ -9,6 +9,8 @@ Handles real-time PR events from GitHub webhooks:
 
 import os
 import asyncio
+import logging
+import weakref
 from typing import Dict, Any, Optional
 from datetime import datetime
 import structlog
@@ -20,15 +22,57 @@ from data.models import ReviewInput, GitHubReview
 
 logger = structlog.get_logger()
 
+# Max review pipelines running at once (each holds a worker thread and LLM calls)
+PIPELINE_CONCURRENCY = int(os.getenv("PIPELINE_CONCURRENCY", "4"))
+
+# Summary posted on the PR when a review fails (error text is clipped so a
+# huge traceback can't bloat the comment)
+MAX_ERROR_CHARS = 2000
+_ERROR_TEMPLATE = """## ❌ Code Review Failed
+
+An error occurred while processing this PR:
+
+```
+{err}
+```
+
+Please check the logs or contact the administrator.
+"""
+
+
+def _warm_review_pipeline():
+    """Import the crew/LLM stack in a worker thread (failures surface later in the pipeline)."""
+    try:
+        from core.crew import ReviewCrew
+        ReviewCrew.warmup()
+    except Exception as e:
+        logger.warning("review_pipeline_warmup_failed", error=str(e))
+
 
 class WebhookHandler:
     """Process GitHub webhook events and trigger code reviews."""
     
+    # One limit per event loop, shared by all handlers on it, so concurrent
+    # deliveries queue instead of piling up (a semaphore can't cross loops)
+    _pipeline_sems: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+    
+    @classmethod
+    def _pipeline_semaphore(cls) -> asyncio.Semaphore:
+        """Return the pipeline semaphore for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        sem = cls._pipeline_sems.get(loop)
+        if sem is None:
+            sem = cls._pipeline_sems[loop] = asyncio.Semaphore(PIPELINE_CONCURRENCY)
+        return sem
+    
     def __init__(self):
         """Initialize webhook handler with GitHub clients."""
         self.client = GitHubClient()
         self.pr_fetcher = PRFetcher(self.client)
         self.commenter = GitHubCommenter(self.client)
+        
+        # Bound once; per-event fields are bound on top of this
+        self.log = logger.bind(component="webhook_handler")
     
     async def process_pr_event(
         self,
@@ -57,7 +101,7 @@ class WebhookHandler:
             repo_full_name = repo_data.get("full_name", "")
             pr_number = pr_data.get("number", 0)
             
-            logger.info(
+            self.log.info(
                 "processing_pr_event",
                 action=action,
                 repo=repo_full_name,
@@ -73,7 +117,7 @@ class WebhookHandler:
             elif action == "reopened":
                 return await self.handle_reopened(payload, delivery_id)
             else:
-                logger.info(
+                self.log.info(
                     "unsupported_action",
                     action=action,
                     repo=repo_full_name,
@@ -86,7 +130,7 @@ class WebhookHandler:
                 }
         
         except Exception as e:
-            logger.error(
+            self.log.error(
                 "webhook_processing_failed",
                 error=str(e),
                 delivery_id=delivery_id,
@@ -97,7 +141,7 @@ class WebhookHandler:
             try:
                 await self._post_error_comment(payload, str(e))
             except Exception as comment_error:
-                logger.error(
+                self.log.error(
                     "failed_to_post_error_comment",
                     error=str(comment_error)
                 )
@@ -119,7 +163,7 @@ class WebhookHandler:
         Returns:
             Processing results
         """
-        logger.info("handling_pr_opened", delivery_id=delivery_id)
+        self.log.info("handling_pr_opened", delivery_id=delivery_id)
         
         # Extract PR details
         pr_data = payload.get("pull_request", {})
@@ -128,8 +172,12 @@ class WebhookHandler:
         repo_full_name = repo_data.get("full_name", "")
         pr_number = pr_data.get("number", 0)
         
+        # Warm up the review pipeline while the PR files are fetched
+        warmup = asyncio.create_task(asyncio.to_thread(_warm_review_pipeline))
+        
         # Fetch full PR data
         pr_info = await self.pr_fetcher.get_full_pr_data(repo_full_name, pr_number)
+        await warmup
         
         # Execute review pipeline
         review_result = await self._execute_review_pipeline(pr_info, delivery_id)
@@ -179,7 +227,7 @@ class WebhookHandler:
         Returns:
             Processing results
         """
-        logger.info("handling_pr_synchronize", delivery_id=delivery_id)
+        self.log.info("handling_pr_synchronize", delivery_id=delivery_id)
         
         # For now, perform full review (same as opened)
         # TODO Phase 10: Implement incremental review
@@ -200,7 +248,7 @@ class WebhookHandler:
         Returns:
             Processing results
         """
-        logger.info("handling_pr_reopened", delivery_id=delivery_id)
+        self.log.info("handling_pr_reopened", delivery_id=delivery_id)
         
         # Perform full review (same as opened)
         return await self.handle_opened(payload, delivery_id)
@@ -225,20 +273,12 @@ class WebhookHandler:
             from core.crew import ReviewCrew
             from core.execution import execute_review_pipeline
             
-            logger.info(
-                "executing_review_pipeline",
-                repo=pr_data.repo_name,
-                pr_number=pr_data.pr_number,
-                delivery_id=delivery_id
-            )
+            log = self.log.bind(repo=pr_data.repo_name, pr_number=pr_data.pr_number)
+            # Skip building event dicts when INFO is filtered out
+            info_enabled = log.is_enabled_for(logging.INFO)
             
-            # Create review input
-            review_input = {
-                "repo_name": pr_data.repo_name,
-                "pr_number": pr_data.pr_number,
-                "diff_content": pr_data.full_diff,
-                "files_changed": [f.filename for f in pr_data.files_changed]
-            }
+            if info_enabled:
+                log.info("executing_review_pipeline", delivery_id=delivery_id)
             
             # Execute CrewAI pipeline (Phase 15: Production)
             # Create ReviewInput for the pipeline
@@ -250,27 +290,23 @@ class WebhookHandler:
                 files_changed=[f.filename for f in pr_data.files_changed]
             )
             
-            logger.info(
-                "executing_crewai_pipeline",
-                repo=pr_data.repo_name,
-                pr_number=pr_data.pr_number,
-                files_count=len(pr_data.files_changed)
-            )
+            if info_enabled:
+                log.info("executing_crewai_pipeline", files_count=len(pr_data.files_changed))
             
-            # Execute the full CrewAI review pipeline
-            result = await execute_review_pipeline(review_input)
+            # Execute the full CrewAI review pipeline (crew kickoff runs in a worker thread)
+            async with self._pipeline_semaphore():
+                result = await execute_review_pipeline(review_input)
             
-            logger.info(
-                "crewai_pipeline_completed",
-                repo=pr_data.repo_name,
-                pr_number=pr_data.pr_number,
-                findings_count=len(result.inline_comments) if result else 0
-            )
+            if info_enabled:
+                log.info(
+                    "crewai_pipeline_completed",
+                    findings_count=len(result.inline_comments) if result else 0
+                )
             
             return result
         
         except Exception as e:
-            logger.error(
+            self.log.error(
                 "review_pipeline_failed",
                 error=str(e),
                 delivery_id=delivery_id,
@@ -298,16 +334,7 @@ class WebhookHandler:
         
         error_review = GitHubReview(
             inline_comments=[],
-            summary_comment=f"""## ❌ Code Review Failed
-
-An error occurred while processing this PR:
-
-```
-{error_message}
-```
-
-Please check the logs or contact the administrator.
-""",
+            summary_comment=_ERROR_TEMPLATE.format(err=error_message[:MAX_ERROR_CHARS]),
             review_state="COMMENTED"
         )
         
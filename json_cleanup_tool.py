@@ -1,15 +1,84 @@
-import json
 import re
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import orjson
 
 #python json_cleanup_tool.py path\to\your\file.json
+
+# Compiled once at import instead of on every call
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+# Pattern to match: "[number].message": "..." (on raw bytes; only matches get decoded)
+_MSG_RE = re.compile(rb'"\[(\d+)\]\.message":\s*(".*")')
+# Decorative box-drawing glyphs from terminal output, removed in one pass
+_STRIP_TABLE = str.maketrans('', '', '│─┌┐└┘├┤┬┴┼')
+# Inputs at least this large are scanned by a process pool
+PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+
 def strip_ansi_codes(text):
     """
     Removes ANSI escape sequences from a string.
     """
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    # Most messages carry no escapes; skip the regex engine entirely for them
+    if '\x1B' not in text:
+        return text
+    return _ANSI_RE.sub('', text)
+
+def _scan_range(input_file, start, end):
+    """
+    Extracts message entries from the lines of input_file that start in [start, end).
+    
+    Returns:
+        Tuple of (indices, cleaned messages) in file order
+    """
+    indices = []
+    cleaned_data = []
+
+    with open(input_file, 'rb') as f:
+        if start:
+            # Skip the partial line; it belongs to the previous range
+            f.seek(start - 1)
+            f.readline()
+        pos = f.tell()
+        # Line-at-a-time keeps memory flat and tolerates corrupted regions
+        # that would stop a strict (streaming) JSON parser
+        for line in f:
+            if pos >= end:
+                break
+            pos += len(line)
+            # Cheap substring test before entering the regex engine
+            if b'].message"' not in line:
+                continue
+            line = line.strip()
+            match = _MSG_RE.search(line)
+            if match:
+                index = match.group(1)
+                message_raw = match.group(2).strip()
+                
+                if message_raw.endswith(b','):
+                    message_raw = message_raw[:-1]
+                # Corrupted regions may hold invalid UTF-8; keep the entry
+                message_raw = message_raw.decode('utf-8', errors='replace')
+                
+                inner = message_raw[1:-1]
+                if '\\' not in inner and '"' not in inner and message_raw.endswith('"'):
+                    # Plain literal: nothing to unescape, skip the parser
+                    message_val = inner
+                else:
+                    try:
+                        message_val = orjson.loads(message_raw)
+                    except Exception:
+                        message_val = message_raw.strip('"')
+
+                cleaned_msg = strip_ansi_codes(message_val)
+                cleaned_msg = cleaned_msg.translate(_STRIP_TABLE).strip()
+
+                indices.append(int(index))
+                cleaned_data.append(cleaned_msg)
+
+    return indices, cleaned_data
 
 def cleanup_corrupted_json(input_file):
     """
@@ -19,46 +88,48 @@ def cleanup_corrupted_json(input_file):
     3. Converting the result into a flat list of message strings.
     """
     output_file = input_file + ".tmp"
-    cleaned_data = {}
 
     print(f"Reading {input_file}...")
 
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Pattern to match: "[number].message": "..."
-                match = re.search(r'"\[(\d+)\]\.message":\s*(".*")', line)
-                if match:
-                    index = match.group(1)
-                    message_raw = match.group(2).strip()
-                    
-                    if message_raw.endswith(','):
-                        message_raw = message_raw[:-1]
-                    
-                    try:
-                        message_val = json.loads(message_raw)
-                    except Exception:
-                        message_val = message_raw.strip('"')
-
-                    cleaned_msg = strip_ansi_codes(message_val)
-                    cleaned_msg = cleaned_msg.replace('│', '').strip()
-
-                    cleaned_data[int(index)] = cleaned_msg
+        size = os.path.getsize(input_file)
+        workers = os.cpu_count() or 1
+        if size < PARALLEL_MIN_BYTES or workers == 1:
+            indices, cleaned_data = _scan_range(input_file, 0, size)
+        else:
+            # re holds the GIL, so large inputs are split across processes in
+            # newline-aligned byte ranges; results are merged back in file order
+            step = -(-size // workers)
+            starts = range(0, size, step)
+            ends = [min(start + step, size) for start in starts]
+            indices = []
+            cleaned_data = []
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for part_indices, part_data in pool.map(
+                    _scan_range, repeat(input_file), starts, ends
+                ):
+                    indices.extend(part_indices)
+                    cleaned_data.extend(part_data)
 
         if not cleaned_data:
             print("No valid message entries found.")
             return
 
-        # Sort by index and then take only the values
-        sorted_indices = sorted(cleaned_data.keys())
-        final_list = [cleaned_data[i] for i in sorted_indices]
+        # Exports list messages in index order, so keep them as collected and
+        # only fall back to sorting (last duplicate wins) if that turns out false
+        if all(a < b for a, b in zip(indices, indices[1:])):
+            final_list = cleaned_data
+        else:
+            # Sort by index and then take only the values
+            by_index = dict(zip(indices, cleaned_data))
+            final_list = [by_index[i] for i in sorted(by_index)]
 
         print(f"Writing cleaned data (preserved {len(final_list)} entries as a list)...")
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with open(output_file, 'wb', buffering=1 << 20) as f:
             # We wrap the results in a new structured object or just a plain list. 
             # Given the request "keep values only", a list is most efficient.
-            json.dump({"messages": final_list}, f, indent=4, ensure_ascii=False)
+            # Compact UTF-8 output (no indentation), written through a 1 MiB buffer
+            f.write(orjson.dumps({"messages": final_list}))
 
         os.replace(output_file, input_file)
         print(f"Successfully cleaned: {input_file}")
@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+import asyncio
 import structlog
 import os
 import psutil
@@ -11,13 +12,17 @@ logger = structlog.get_logger()
 # In a real deployed scenario, we'd pull these from the SQL DB or Prometheus
 _start_time = time.time()
 
+# One handle for the process lifetime; cpu_percent(None) measures since the
+# previous call, so prime it here to get real numbers from the first scrape
+_PROC = psutil.Process(os.getpid())
+_PROC.cpu_percent(None)
+
 @router.get("/metrics")
 async def get_metrics():
     """
     Expose production metrics for monitoring.
     """
-    process = psutil.Process(os.getpid())
-    memory_info = process.memory_info()
+    memory_info = _PROC.memory_info()
     
     # Calculate uptime
     uptime_seconds = time.time() - _start_time
@@ -27,13 +32,13 @@ async def get_metrics():
     metrics = {
         "system": {
             "uptime_seconds": uptime_seconds,
-            "cpu_percent": process.cpu_percent(),
+            "cpu_percent": _PROC.cpu_percent(None),
             "memory_usage_mb": memory_info.rss / 1024 / 1024,
         },
         "application": {
             "reviews_processed_total": 0, # TODO: hook up to DB count
             "errors_total": 0,            # TODO: hook up to error logs
-            "active_tasks": len(psutil.pids()) # Proxy for load
+            "active_tasks": len(asyncio.all_tasks()) # Tasks on this event loop
         },
         "costs": {
             "gemini_estimated_cost_usd": 0.0 # Placeholder
@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 import asyncio
+import datetime
 import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import select
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -16,6 +22,25 @@ from github_integration.commenter import GitHubCommenter
 
 #python run_local.py "VijayalakshmiKYADGI/test" 1
 
+# Review reports are written here (created once at startup)
+_LOGS_DIR = Path("logs")
+_LOGS_DIR.mkdir(exist_ok=True)
+# Findings listed per section in the detailed log (the rest are counted)
+MAX_LOGGED_FINDINGS = 200
+
+def _drain_stdin():
+    """Discard keystrokes typed while the review ran so they can't answer the prompt."""
+    if sys.platform == 'win32':
+        while msvcrt.kbhit():
+            msvcrt.getch()
+        return
+    if not sys.stdin.isatty():
+        return  # Piped input is the intended answer
+    fd = sys.stdin.fileno()
+    while select.select([fd], [], [], 0)[0]:
+        if not os.read(fd, 4096):
+            break
+
 async def run_local_review(repo_name: str, pr_number: int):
     """Run a full review pipeline locally."""
     # 1. Load environment
@@ -36,13 +61,14 @@ async def run_local_review(repo_name: str, pr_number: int):
     print("📡 Fetching PR data from GitHub...")
     pr_info = await fetcher.get_full_pr_data(repo_name, pr_number)
     
-    # 4. Prepare Input
+    # 4. Prepare Input (file list is reused for the logs and for posting)
+    filenames = [f.filename for f in pr_info.files_changed]
     review_input = ReviewInput(
         repo_name=repo_name,
         pr_number=pr_number,
         pr_url=f"https://github.com/{repo_name}/pull/{pr_number}",
         diff_content=pr_info.full_diff,
-        files_changed=[f.filename for f in pr_info.files_changed]
+        files_changed=filenames
     )
     
     # 5. Execute Pipeline
@@ -61,113 +87,72 @@ async def run_local_review(repo_name: str, pr_number: int):
     print()
 
     # --- LOG RESULTS TO FILE ---
-    import datetime
-    import json
-    
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_filename = f"logs/review_{timestamp}.txt"
-    os.makedirs("logs", exist_ok=True)
-    
-    with open(log_filename, "w", encoding="utf-8") as f:
-        f.write(f"REVIEW REPORT - {timestamp}\n")
-        f.write(f"Repo: {repo_name} | PR #{pr_number}\n")
-        f.write("="*50 + "\n\n")
-        
-        f.write(f"STATE: {result.review_state}\n")
-        f.write(f"SUMMARY: {result.summary_comment}\n\n")
+    log_filename = _LOGS_DIR / f"review_{timestamp}.txt"
+    
+    # Shared sections are formatted once and reused by both log files
+    header = f"Repo: {repo_name} | PR #{pr_number}\n" + "="*50 + "\n\n"
+    files_block = "".join(f"- {filename}\n" for filename in filenames) + "\n"
+    state_block = f"STATE: {result.review_state}\nSUMMARY: {result.summary_comment}\n\n"
+    
+    parts = [
+        f"REVIEW REPORT - {timestamp}\n{header}{state_block}--- PROCESSED FILES ---\n{files_block}"
+        f"--- FINDINGS ({len(result.inline_comments)}) ---"
+    ]
+    shown = result.inline_comments[:MAX_LOGGED_FINDINGS]
+    for finding in shown:
+        parts.append(f"{finding['file_path']}:{finding['line_number']}\nComment: {finding['comment']}\n--------------------")
+    if len(result.inline_comments) > len(shown):
+        parts.append(f"... {len(result.inline_comments) - len(shown)} more omitted")
         
-        f.write("--- PROCESSED FILES ---\n")
-        for filename in [f.filename for f in pr_info.files_changed]:
-            f.write(f"- {filename}\n")
-        f.write("\n")
-        
-        f.write(f"--- FINDINGS ({len(result.inline_comments)}) ---\n")
-        for finding in result.inline_comments:
-            f.write(f"{finding.file_path}:{finding.line_number}\n")
-            f.write(f"Comment: {finding.comment}\n")
-            f.write("-" * 20 + "\n")
-            
-        if result.pre_existing_findings:
-            f.write(f"\n--- PRE-EXISTING ISSUES ({len(result.pre_existing_findings)}) ---\n")
-            for finding in result.pre_existing_findings:
-                f.write(f"{finding.file_path}:{finding.line_number}\n")
-                f.write(f"Comment: {finding.comment}\n")
-                f.write("-" * 20 + "\n")
-
+    if result.pre_existing_findings:
+        parts.append(f"\n--- PRE-EXISTING ISSUES ({len(result.pre_existing_findings)}) ---")
+        shown = result.pre_existing_findings[:MAX_LOGGED_FINDINGS]
+        for finding in shown:
+            parts.append(f"{finding['file_path']}:{finding['line_number']}\nComment: {finding['comment']}\n--------------------")
+        if len(result.pre_existing_findings) > len(shown):
+            parts.append(f"... {len(result.pre_existing_findings) - len(shown)} more omitted")
+    
+    log_filename.write_text("\n".join(parts) + "\n", encoding="utf-8")
     print(f"📄 Detailed review log saved to: {log_filename}")
     
     # --- ALSO CREATE FIXED LOG FILE ---
-    fixed_log_path = "logs/log.txt"
-    with open(fixed_log_path, "w", encoding="utf-8") as f:
-        f.write(f"LATEST REVIEW - {timestamp}\n")
-        f.write(f"Repo: {repo_name} | PR #{pr_number}\n")
-        f.write("="*50 + "\n\n")
-        
-        f.write("--- FILES PROCESSED ---\n")
-        for filename in [f.filename for f in pr_info.files_changed]:
-            f.write(f"- {filename}\n")
-        f.write("\n")
-        
-        f.write(f"STATE: {result.review_state}\n")
-        f.write(f"SUMMARY: {result.summary_comment}\n\n")
-        
-        f.write(f"FINDINGS: {len(result.inline_comments)}\n")
-        if result.pre_existing_findings:
-            f.write(f"PRE-EXISTING ISSUES: {len(result.pre_existing_findings)}\n")
+    fixed_log_path = _LOGS_DIR / "log.txt"
+    summary = f"FINDINGS: {len(result.inline_comments)}\n"
+    if result.pre_existing_findings:
+        summary += f"PRE-EXISTING ISSUES: {len(result.pre_existing_findings)}\n"
+    fixed_log_path.write_text(
+        f"LATEST REVIEW - {timestamp}\n{header}--- FILES PROCESSED ---\n{files_block}{state_block}{summary}",
+        encoding="utf-8"
+    )
     
     print(f"📄 Fixed log file updated: {fixed_log_path}")
     
     # 7. Post to GitHub?
-    # Clear input buffer on Windows to prevent skipped prompts
-    import sys
-    import time
-    if sys.platform == 'win32':
+    # AUTO_POST=y|n answers without prompting (non-interactive runs)
+    choice = os.getenv("AUTO_POST", "").strip().lower()
+    if choice not in ('y', 'n'):
+        _drain_stdin()
         try:
-            import msvcrt
-            while msvcrt.kbhit():
-                msvcrt.getch()
-        except:
-            pass
-    
-    # Small delay to ensure buffer is clear
-    time.sleep(0.1)
-    
-    # Prompt with retry logic
-    max_attempts = 3
-    for attempt in range(max_attempts):
-        choice = input("Do you want to post these results to GitHub? (y/n): ").strip().lower()
-        
-        if choice in ['y', 'n']:
-            break
-        elif choice == '':
-            if attempt < max_attempts - 1:
-                print("⚠️ No input detected. Please try again.")
-                time.sleep(0.2)
-            else:
-                print("⚠️ No valid input after 3 attempts. Defaulting to 'n'.")
-                choice = 'n'
-        else:
-            print(f"⚠️ Invalid input '{choice}'. Please enter 'y' or 'n'.")
-            if attempt == max_attempts - 1:
-                choice = 'n'
+            choice = input("Do you want to post these results to GitHub? (y/N): ").strip().lower()
+        except EOFError:
+            choice = 'n'
     
     if choice == 'y':
-        valid_paths = [f.filename for f in pr_info.files_changed]
-        await commenter.post_review(repo_name, pr_number, result, valid_paths=valid_paths, diff_content=pr_info.full_diff)
+        await commenter.post_review(repo_name, pr_number, result, valid_paths=filenames, diff_content=pr_info.full_diff)
         print("✨ Posted to GitHub successfully!")
     else:
         print("🚫 Review not posted.")
 
 if __name__ == "__main__":
-    import argparse
-    parser = argparse.ArgumentParser(description="Run AI Code Review locally.")
-    parser.add_argument("repo", help="Repository name (e.g., owner/repo)")
-    parser.add_argument("pr", type=int, help="Pull Request number")
-    
-    args = parser.parse_args()
+    # Two positionals only: plain sys.argv keeps argparse off the startup path
+    if len(sys.argv) != 3 or not sys.argv[2].isdigit():
+        print("usage: run_local.py REPO PR  (e.g. owner/repo 42)")
+        sys.exit(2)
+    repo, pr = sys.argv[1], int(sys.argv[2])
     
     try:
-        asyncio.run(run_local_review(args.repo, args.pr))
+        asyncio.run(run_local_review(repo, pr))
     except Exception as e:
         print(f"💥 CRASHED: {e}")
         import traceback
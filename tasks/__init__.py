@@ -6,3 +6,4 @@ from .architecture_task import ArchitectureAnalysisTask
 from .aggregate_task import AggregateFindingsTask
 from .format_comments_task import FormatCommentsTask
 from .task_graph import TaskGraph
+from .comprehensive_review_task import ComprehensiveReviewTask, split_by_severity
@@ -1,29 +1,41 @@
 from textwrap import dedent
-from crewai import Task, Agent
-from tools import FindingAggregator, FindingAggregatorTool
+from typing import TYPE_CHECKING
+from .task_factory import build_task
 from data.models import ReviewSummary, ReviewFinding
 import json
 
+if TYPE_CHECKING:
+    from crewai import Task, Agent
+
+# Fixed description, dedented once at import
+_DESCRIPTION = dedent("""\
+    Aggregate findings from all previous analysis steps.
+    
+    1. Collect outputs from Quality, Performance, Security, and Architecture tasks.
+    2. Deduplicate findings (same issue reported by multiple agents).
+    3. Prioritize by severity (CRITICAL > HIGH > MEDIUM > LOW).
+    4. Drop low-value noise if total findings > 100.
+    
+    Return a consolidated summary.
+""")
+
+def _finding_aggregator_tool():
+    from tools import FindingAggregatorTool
+    return FindingAggregatorTool()
+
 class AggregateFindingsTask:
     def __init__(self):
+        # Deferred so importing tasks doesn't load crewai/tree-sitter via tools
+        from tools import FindingAggregator
         self.aggregator = FindingAggregator()
 
-    def create(self, agent: Agent, context_tasks: list[Task]) -> Task:
-        return Task(
-            description=dedent("""\
-                Aggregate findings from all previous analysis steps.
-                
-                1. Collect outputs from Quality, Performance, Security, and Architecture tasks.
-                2. Deduplicate findings (same issue reported by multiple agents).
-                3. Prioritize by severity (CRITICAL > HIGH > MEDIUM > LOW).
-                4. Drop low-value noise if total findings > 100.
-                
-                Return a consolidated summary.
-            """),
+    def create(self, agent: "Agent", context_tasks: list["Task"]) -> "Task":
+        return build_task(
+            description=_DESCRIPTION,
             expected_output="A specific ReviewSummary object in JSON format.",
             agent=agent,
             context=context_tasks,
             tools=[
-                FindingAggregatorTool()
+                _finding_aggregator_tool()
             ]
         )
@@ -1,20 +1,27 @@
 from textwrap import dedent
-from crewai import Task, Agent
+from typing import TYPE_CHECKING
+from .task_factory import build_task
+
+if TYPE_CHECKING:
+    from crewai import Task, Agent
+
+# Fixed description, dedented once at import
+_DESCRIPTION = dedent("""\
+    Analyze the software Architecture and Design.
+    
+    Focus on:
+    - SOLID principles (SRP, OCP, etc.)
+    - Design patterns usage (or misuse)
+    - Coupling and cohesion
+    - "God Classes" or monolithic functions
+    
+    Use AST parsing to understand the class hierarchy and dependencies.
+""")
 
 class ArchitectureAnalysisTask:
-    def create(self, agent: Agent, context_tasks: list[Task]) -> Task:
-        return Task(
-            description=dedent("""\
-                Analyze the software Architecture and Design.
-                
-                Focus on:
-                - SOLID principles (SRP, OCP, etc.)
-                - Design patterns usage (or misuse)
-                - Coupling and cohesion
-                - "God Classes" or monolithic functions
-                
-                Use AST parsing to understand the class hierarchy and dependencies.
-            """),
+    def create(self, agent: "Agent", context_tasks: list["Task"]) -> "Task":
+        return build_task(
+            description=_DESCRIPTION,
             expected_output="A list of ReviewFinding objects in JSON format representing architectural insights.",
             agent=agent,
             context=context_tasks
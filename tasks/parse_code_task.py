@@ -1,34 +1,68 @@
+from functools import lru_cache
 from textwrap import dedent
-from crewai import Task, Agent
-from tools import DiffParser, TreeSitterParser, DiffParsingTool
+from typing import TYPE_CHECKING
+from .task_factory import build_task
 from data.models import ReviewInput
 
+if TYPE_CHECKING:
+    from crewai import Task, Agent
+    from tools import DiffParser, TreeSitterParser, DiffParsingTool
+
+# Dedented once at import; only the PR fields and diff are filled in per call
+_DESC_TEMPLATE = dedent("""\
+    Analyze the provided PR diff content and extract metadata.
+    
+    PR Details:
+    Repo: {repo_name}
+    PR #{pr_number}
+    
+    Your job is to:
+    1. Parse the diff content to identify changed files.
+    2. Validate that valid Python code blocks can be extracted.
+    3. Prepare the input for the next steps.
+    
+    DIFF CONTENT:
+    {diff_content}
+""")
+
+# tools (crewai, tree-sitter) is imported on first use, not with the package
+
+# Stateless, so one instance is shared by every ParseCodeTask
+@lru_cache(maxsize=1)
+def _shared_diff_parsing_tool() -> "DiffParsingTool":
+    from tools import DiffParsingTool
+    return DiffParsingTool()
+
+@lru_cache(maxsize=1)
+def _shared_diff_parser() -> "DiffParser":
+    from tools import DiffParser
+    return DiffParser()
+
+@lru_cache(maxsize=1)
+def _shared_tree_parser() -> "TreeSitterParser":
+    from tools import TreeSitterParser
+    return TreeSitterParser()
+
 class ParseCodeTask:
-    def __init__(self):
-        self.diff_parser = DiffParser()
-        self.tree_parser = TreeSitterParser()
-
-    def create(self, agent: Agent, diff_content: str, pr_details: dict) -> Task:
-        return Task(
-            description=dedent(f"""\
-                Analyze the provided PR diff content and extract metadata.
-                
-                PR Details:
-                Repo: {pr_details.get('repo_name')}
-                PR #{pr_details.get('pr_number')}
-                
-                Your job is to:
-                1. Parse the diff content to identify changed files.
-                2. Validate that valid Python code blocks can be extracted.
-                3. Prepare the input for the next steps.
-                
-                DIFF CONTENT:
-                {diff_content}
-            """),
+    # Parsers are process-wide and built on first access (the tree-sitter
+    # grammar load no longer runs on every TaskGraph build)
+    @property
+    def diff_parser(self) -> "DiffParser":
+        return _shared_diff_parser()
+
+    @property
+    def tree_parser(self) -> "TreeSitterParser":
+        return _shared_tree_parser()
+
+    def create(self, agent: "Agent", diff_content: str, pr_details: dict) -> "Task":
+        return build_task(
+            description=_DESC_TEMPLATE.format(
+                repo_name=pr_details.get('repo_name'),
+                pr_number=pr_details.get('pr_number'),
+                diff_content=diff_content
+            ),
             expected_output="A structured summary of files changed and their validity for review.",
             agent=agent,
-            tools=[
-                DiffParsingTool()
-            ],
+            tools=[_shared_diff_parsing_tool()],
             context=[] # No previous context
         )
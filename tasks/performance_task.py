@@ -1,21 +1,28 @@
 from textwrap import dedent
-from crewai import Task, Agent
+from typing import TYPE_CHECKING
+from .task_factory import build_task
+
+if TYPE_CHECKING:
+    from crewai import Task, Agent
+
+# Fixed description, dedented once at import
+_DESCRIPTION = dedent("""\
+    Analyze the code for Performance and Complexity issues.
+    
+    Focus on:
+    - High cyclomatic complexity (>10)
+    - Nested loops (O(n^2) or worse)
+    - Inefficient list comprehensions
+    - Resource leaks
+    
+    Use Radon to measure complexity.
+    Review the code structure for algorithmic traps.
+""")
 
 class PerformanceAnalysisTask:
-    def create(self, agent: Agent, context_tasks: list[Task]) -> Task:
-        return Task(
-            description=dedent("""\
-                Analyze the code for Performance and Complexity issues.
-                
-                Focus on:
-                - High cyclomatic complexity (>10)
-                - Nested loops (O(n^2) or worse)
-                - Inefficient list comprehensions
-                - Resource leaks
-                
-                Use Radon to measure complexity.
-                Review the code structure for algorithmic traps.
-            """),
+    def create(self, agent: "Agent", context_tasks: list["Task"]) -> "Task":
+        return build_task(
+            description=_DESCRIPTION,
             expected_output="A list of ReviewFinding objects in JSON format representing performance bottlenecks.",
             agent=agent,
             context=context_tasks
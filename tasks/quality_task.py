@@ -1,23 +1,30 @@
 from textwrap import dedent
-from crewai import Task, Agent
+from typing import TYPE_CHECKING
+from .task_factory import build_task
 from data.models import ReviewFinding
 
+if TYPE_CHECKING:
+    from crewai import Task, Agent
+
+# Fixed description, dedented once at import
+_DESCRIPTION = dedent("""\
+    Analyze the code files identified in the previous step for Quality issues.
+    
+    Focus on:
+    - PEP8 style violations
+    - Naming conventions
+    - Code smells (missing docstrings, complex imports)
+    - Readability
+    
+    Use your tools (Pylint, AST) to scan the code.
+    For every issue found, check if it's a false positive.
+    Return a list of findings.
+""")
+
 class QualityAnalysisTask:
-    def create(self, agent: Agent, context_tasks: list[Task]) -> Task:
-        return Task(
-            description=dedent("""\
-                Analyze the code files identified in the previous step for Quality issues.
-                
-                Focus on:
-                - PEP8 style violations
-                - Naming conventions
-                - Code smells (missing docstrings, complex imports)
-                - Readability
-                
-                Use your tools (Pylint, AST) to scan the code.
-                For every issue found, check if it's a false positive.
-                Return a list of findings.
-            """),
+    def create(self, agent: "Agent", context_tasks: list["Task"]) -> "Task":
+        return build_task(
+            description=_DESCRIPTION,
             expected_output="A list of ReviewFinding objects in JSON format representing quality issues.",
             agent=agent,
             context=context_tasks,
@@ -1,21 +1,28 @@
 from textwrap import dedent
-from crewai import Task, Agent
+from typing import TYPE_CHECKING
+from .task_factory import build_task
+
+if TYPE_CHECKING:
+    from crewai import Task, Agent
+
+# Fixed description, dedented once at import
+_DESCRIPTION = dedent("""\
+    Scan the code for Security Vulnerabilities.
+    
+    Focus on:
+    - Hardcoded secrets/passwords (CRITICAL)
+    - SQL Injection risks
+    - Unsafe input handling
+    - Common CVE patterns
+    
+    Use Bandit to scan the code.
+    If CRITICAL issues are found, highlight them prominently.
+""")
 
 class SecurityAnalysisTask:
-    def create(self, agent: Agent, context_tasks: list[Task]) -> Task:
-        return Task(
-            description=dedent("""\
-                Scan the code for Security Vulnerabilities.
-                
-                Focus on:
-                - Hardcoded secrets/passwords (CRITICAL)
-                - SQL Injection risks
-                - Unsafe input handling
-                - Common CVE patterns
-                
-                Use Bandit to scan the code.
-                If CRITICAL issues are found, highlight them prominently.
-            """),
+    def create(self, agent: "Agent", context_tasks: list["Task"]) -> "Task":
+        return build_task(
+            description=_DESCRIPTION,
             expected_output="A list of ReviewFinding objects in JSON format representing security risks.",
             agent=agent,
             context=context_tasks
@@ -0,0 +1,61 @@
+"""
+Shared Task construction for the task factories.
+"""
+
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from crewai import Task
+
+# Opt-in: build tasks with Task.model_construct (skips field validation).
+# Task inputs are all generated internally; leave unset to keep strict validation.
+FAST_TASK_CONSTRUCT = os.getenv("FAST_TASK_CONSTRUCT", "0") == "1"
+
+
+@lru_cache(maxsize=1)
+def _task_cls() -> type["Task"]:
+    """crewai.Task, imported on the first build so importing tasks stays cheap."""
+    from crewai import Task
+    return Task
+
+
+@lru_cache(maxsize=1)
+def get_review_mode() -> str:
+    """
+    REVIEW_MODE for this process, read on first use.
+
+    Read lazily (not at import) so entry points that call load_dotenv()
+    after importing the tasks still take effect; call
+    get_review_mode.cache_clear() to pick up a changed value.
+
+    Returns:
+        'changes_only' (default) or 'full_file'
+    """
+    return os.getenv("REVIEW_MODE", "changes_only")
+
+
+def build_task(**fields) -> "Task":
+    """
+    Create a crewai Task from trusted, internally generated fields.
+
+    With FAST_TASK_CONSTRUCT=1 the task is built with model_construct and
+    only the after-validators that set up runtime state are replayed
+    (telemetry handle, tools inherited from the agent). Those hooks are
+    specific to the pinned crewai version (0.51.1).
+
+    Args:
+        **fields: Task fields (description, expected_output, agent, ...)
+
+    Returns:
+        Task instance
+    """
+    Task = _task_cls()
+    if not FAST_TASK_CONSTRUCT:
+        return Task(**fields)
+
+    task = Task.model_construct(**fields)
+    task.set_private_attrs()
+    task.check_tools()
+    return task
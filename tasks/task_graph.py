@@ -1,30 +1,27 @@
-from typing import List, Dict
-from crewai import Task, Agent
+from typing import Dict, Tuple, TYPE_CHECKING
 
 from .parse_code_task import ParseCodeTask
-from .quality_task import QualityAnalysisTask
-from .performance_task import PerformanceAnalysisTask
-from .security_task import SecurityAnalysisTask
-from .architecture_task import ArchitectureAnalysisTask
-from .aggregate_task import AggregateFindingsTask
 from .format_comments_task import FormatCommentsTask
 from .comprehensive_review_task import ComprehensiveReviewTask
 
+if TYPE_CHECKING:
+    from crewai import Task, Agent
+
 class TaskGraph:
     """Manages the dependency chain of review tasks."""
     
-    def get_task_sequence(self, agents: Dict[str, Agent], diff_content: str, pr_details: Dict) -> List[Task]:
+    def get_task_sequence(self, agents: Dict[str, "Agent"], diff_content: str, pr_details: Dict) -> Tuple["Task", ...]:
         """
         Create the full chain of tasks instantiated with provided agents.
         
         Args:
             agents: Dict mapping role/key to Agent instance. 
-                   Expected keys: code_quality, performance, security, architecture, report_aggregator
+                   Expected keys: comprehensive, report_aggregator
             diff_content: PR diff string
             pr_details: Dict with repo_name, pr_number logic
             
         Returns:
-            List of instantiated Task objects in sequential order
+            Tuple of instantiated Task objects in sequential order
         """
         
         # 1. Parse (Input)
@@ -49,8 +46,5 @@ class TaskGraph:
             diff_content=diff_content
         )
         
-        return [
-            parse_task,
-            comprehensive_task,
-            fmt_task
-        ]
+        # Fixed-length sequence; Crew validates it into its own list
+        return (parse_task, comprehensive_task, fmt_task)
@@ -9,12 +9,28 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 TEST_PROJECT_SRC = Path("tests/test-project")
 TEST_REPO_NAME = "my-test-app-local"
 TEST_REPO_DIR = Path(f"temp_{TEST_REPO_NAME}")
 
+# Branches that trigger each review type, and the file each one modifies
+BRANCHES = [
+    ("test-quality", "flawed_quality.py"),
+    ("test-security", "vulnerable_security.py"),
+    ("test-performance", "slow_performance.py"),
+]
+
+# git worktree add updates shared admin files, so only the commits run in parallel
+_worktree_lock = threading.Lock()
+
+def _git(*args: str, cwd: Path = TEST_REPO_DIR):
+    """Run a git command with stdout discarded (stderr still shows failures)."""
+    subprocess.run(["git", *args], cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+
 def setup_local_test_repo():
     """Create a temporary git repo from the test project files."""
     print(f"Creating local test repo in {TEST_REPO_DIR}...")
@@ -26,9 +42,9 @@ def setup_local_test_repo():
     shutil.copytree(TEST_PROJECT_SRC, TEST_REPO_DIR)
     
     # Init git
-    subprocess.run(["git", "init"], cwd=TEST_REPO_DIR, check=True)
-    subprocess.run(["git", "add", "."], cwd=TEST_REPO_DIR, check=True)
-    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=TEST_REPO_DIR, check=True)
+    _git("init")
+    _git("add", ".")
+    _git("commit", "-m", "Initial commit")
     
     print("Local repo created successfully.")
 
@@ -36,20 +52,20 @@ def simulate_branch_push(branch_name: str, flawed_file: str):
     """Simulate creating a feature branch and pushing changes."""
     print(f"\nSimulating push for {branch_name}...")
     
-    # Create branch
-    subprocess.run(["git", "checkout", "-b", branch_name], cwd=TEST_REPO_DIR, check=True)
+    # Create the branch in its own worktree so branches don't share a checkout
+    worktree = f".worktrees/{branch_name}"
+    with _worktree_lock:
+        _git("worktree", "add", "-q", "-b", branch_name, worktree)
+    worktree_dir = TEST_REPO_DIR / worktree
     
     # Modify file slightly to ensure change
-    with open(TEST_REPO_DIR / flawed_file, "a") as f:
+    with open(worktree_dir / flawed_file, "a") as f:
         f.write("\n# Trigger change\n")
-        
-    subprocess.run(["git", "add", flawed_file], cwd=TEST_REPO_DIR, check=True)
-    subprocess.run(["git", "commit", "-m", f"Modify {flawed_file}"], cwd=TEST_REPO_DIR, check=True)
     
-    print(f"Branch {branch_name} ready (simulated push).")
+    # The file is tracked, so -a stages it
+    _git("commit", "-am", f"Modify {flawed_file}", cwd=worktree_dir)
     
-    # Return to main
-    subprocess.run(["git", "checkout", "main"], cwd=TEST_REPO_DIR, check=True)
+    print(f"Branch {branch_name} ready (simulated push).")
 
 def cleanup():
     """Remove temp repo."""
@@ -63,10 +79,10 @@ if __name__ == "__main__":
     try:
         setup_local_test_repo()
         
-        # Simulate different workflow triggers
-        simulate_branch_push("test-quality", "flawed_quality.py")
-        simulate_branch_push("test-security", "vulnerable_security.py")
-        simulate_branch_push("test-performance", "slow_performance.py")
+        # Simulate different workflow triggers (one worktree per branch)
+        with ThreadPoolExecutor(max_workers=len(BRANCHES)) as pool:
+            # list() re-raises the first failure here
+            list(pool.map(lambda branch: simulate_branch_push(*branch), BRANCHES))
         
         print("\n✅ Local project structure verification successful.")
         
@@ -22,6 +22,7 @@ from data import (
     ReviewSummary,
     ReviewInput
 )
+from data.models import GitHubReview
 
 
 @pytest.fixture
@@ -191,6 +192,50 @@ def test_pydantic_validation():
     assert valid_input.language == "python"  # Default value
 
 
+def test_github_review_from_llm():
+    """Test GitHubReview.from_llm validates comments and required fields."""
+    review = GitHubReview.from_llm({
+        "inline_comments": [{"file_path": "app.py", "line_number": "12", "comment": "HIGH: bug"}],
+        "summary_comment": "One issue",
+        "review_state": "REQUESTED_CHANGES",
+    })
+    assert review.inline_comments == [{"file_path": "app.py", "line_number": 12, "comment": "HIGH: bug"}]
+    assert review.pre_existing_findings == []
+    assert review.to_json() == GitHubReview(**review.model_dump()).to_json()
+    
+    # Missing optional keys get the InlineComment defaults
+    partial = GitHubReview.from_llm({
+        "inline_comments": [{"comment": "LOW: nit"}],
+        "summary_comment": "x",
+        "review_state": "COMMENTED",
+    })
+    assert partial.inline_comments == [{"comment": "LOW: nit", "file_path": "unknown", "line_number": 1}]
+    validated = GitHubReview(
+        inline_comments=[{"line_number": 3, "comment": "LOW: nit"}],
+        summary_comment="x",
+        review_state="COMMENTED",
+    )
+    assert validated.inline_comments[0]["file_path"] == "unknown"
+    
+    # Comment without body text
+    with pytest.raises(ValidationError):
+        GitHubReview.from_llm({
+            "inline_comments": [{"file_path": "app.py"}],
+            "summary_comment": "x",
+            "review_state": "COMMENTED",
+        })
+    
+    # Missing summary
+    with pytest.raises(KeyError):
+        GitHubReview.from_llm({"review_state": "COMMENTED"})
+    
+    # Unknown verdict
+    with pytest.raises(ValueError):
+        GitHubReview.from_llm({"summary_comment": "x", "review_state": "LGTM"})
+    with pytest.raises(ValidationError):
+        GitHubReview(summary_comment="x", review_state="LGTM")
+
+
 def test_severity_counts_computed(test_db):
     """Test that severity_counts computed property works correctly."""
     findings = [
@@ -15,10 +15,11 @@ import asyncio
 import os
 from unittest.mock import Mock, patch, AsyncMock
 from github import GithubException
+import httpx
 
 # Import GitHub modules
-from github_integration.client import GitHubClient
-from github_integration.pr_fetcher import PRFetcher, PRData, FileChange
+from github_integration.client import GitHubClient, PRSummary, PRFile
+from github_integration.pr_fetcher import PRFetcher, PRData, FileChange, _classify
 from github_integration.commenter import GitHubCommenter
 from github_integration.mocks import MockPRData
 from tasks.format_comments_task import GitHubReview
@@ -122,7 +123,7 @@ async def test_commenter_review_states():
     mock_review = MockPRData.get_sample_github_review()
     
     # Verify review has CRITICAL finding
-    assert any("CRITICAL" in c["body"] for c in mock_review.inline_comments)
+    assert any("CRITICAL" in c["comment"] for c in mock_review.inline_comments)
     
     # Verify review state is REQUESTED_CHANGES
     assert mock_review.review_state == "REQUESTED_CHANGES"
@@ -137,6 +138,89 @@ async def test_commenter_review_states():
         assert "app/auth.py" in preview
 
 
+# Test 5b: Large reviews are split into batches
+@pytest.mark.asyncio
+async def test_commenter_batches_large_reviews():
+    """Test reviews above REVIEW_BATCH_SIZE are posted as several reviews."""
+    review = GitHubReview(
+        inline_comments=[
+            {"file_path": "app.py", "line_number": i, "comment": f"LOW: issue {i}"}
+            for i in range(1, 6)
+        ],
+        summary_comment="Found 5 issues",
+        review_state="REQUESTED_CHANGES"
+    )
+
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_test_token"}):
+        commenter = GitHubCommenter()
+
+        with patch("github_integration.commenter.REVIEW_BATCH_SIZE", 2), \
+             patch("github_integration.commenter.REVIEW_BATCH_DELAY_MS", 0), \
+             patch.object(commenter.client, "create_review", new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = "101"
+            review_id = await commenter.post_review("o/r", 1, review)
+
+        assert review_id == "101"
+        calls = mock_create.call_args_list
+        assert [len(c.kwargs["comments"]) for c in calls] == [2, 2, 1]
+        assert calls[0].kwargs["event"] == "REQUEST_CHANGES"
+        assert all(c.kwargs["event"] == "COMMENT" for c in calls[1:])
+
+
+@pytest.mark.asyncio
+async def test_commenter_rejected_batch_posts_only_remaining():
+    """Test a rejected continuation batch doesn't re-post findings already on the PR."""
+    review = GitHubReview(
+        inline_comments=[
+            {"file_path": "app.py", "line_number": i, "comment": f"LOW: issue {i}"}
+            for i in range(1, 6)
+        ],
+        summary_comment="Found 5 issues",
+        review_state="REQUESTED_CHANGES"
+    )
+
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_test_token"}):
+        commenter = GitHubCommenter()
+
+        with patch("github_integration.commenter.REVIEW_BATCH_SIZE", 2), \
+             patch("github_integration.commenter.REVIEW_BATCH_DELAY_MS", 0), \
+             patch.object(commenter.client, "create_review", new_callable=AsyncMock) as mock_create, \
+             patch.object(commenter.client, "create_issue_comment", new_callable=AsyncMock) as mock_comment:
+            mock_create.side_effect = ["101", ValueError("Invalid review data: 422")]
+            mock_comment.return_value = "201"
+            review_id = await commenter.post_review("o/r", 1, review)
+
+        assert review_id == "101"
+        assert mock_create.call_count == 2
+        mock_comment.assert_called_once()
+        body = mock_comment.call_args.kwargs["body"]
+        # Batch 1 (lines 1-2) was posted; only batches 2 and 3 go in the fallback
+        assert "app.py:L1`" not in body and "app.py:L2`" not in body
+        assert all(f"app.py:L{i}`" in body for i in range(3, 6))
+        assert "Found 5 issues" not in body
+
+
+# Test 5c: REQUEST_CHANGES verdict from the format task
+@pytest.mark.asyncio
+async def test_commenter_request_changes_state():
+    """Test the prompt's REQUEST_CHANGES spelling requests changes on GitHub."""
+    review = GitHubReview(
+        inline_comments=[{"file_path": "app.py", "line_number": 1, "comment": "HIGH: bug"}],
+        summary_comment="One issue",
+        review_state="REQUEST_CHANGES"
+    )
+
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_test_token"}):
+        commenter = GitHubCommenter()
+
+        with patch.object(commenter.client, "create_review", new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = "102"
+            await commenter.post_review("o/r", 1, review)
+
+        assert mock_create.call_args.kwargs["event"] == "REQUEST_CHANGES"
+        assert "❌" in mock_create.call_args.kwargs["body"]
+
+
 # Test 6: File Filtering (Binary/Large Files)
 def test_file_filtering():
     """Test PRFetcher skips binary and large files."""
@@ -158,6 +242,27 @@ def test_file_filtering():
         assert fetcher._should_skip_file(mock_file) is True
 
 
+# Test 6b: Buffered fetcher log reaches its target while idle
+def test_pr_fetcher_log_flushes_on_timer():
+    """Test buffered INFO records are flushed after the flush interval."""
+    import logging.handlers
+    import time
+    from github_integration.pr_fetcher import _TimedMemoryHandler
+    
+    target = logging.handlers.BufferingHandler(capacity=100)
+    handler = _TimedMemoryHandler(
+        capacity=1024, flushLevel=logging.WARNING, target=target, flush_interval=0.05
+    )
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "fetched", None, None)
+    
+    handler.handle(record)
+    assert target.buffer == []
+    
+    time.sleep(0.3)
+    assert target.buffer == [record]
+    handler.close()
+
+
 # Test 7: Large PR Handling
 def test_large_pr_handling():
     """Test PRFetcher handles large files correctly."""
@@ -181,6 +286,33 @@ def test_large_pr_handling():
         assert fetcher._should_skip_file(normal_file) is False
 
 
+# Test 7b: PR data cache keyed on head commit
+@pytest.mark.asyncio
+async def test_pr_fetcher_caches_by_head_sha():
+    """Test repeated fetches of the same head commit reuse the cached PRData."""
+    client = Mock()
+    pr = Mock(html_url="https://github.com/o/r/pull/1", title="Fix")
+    pr.user.login = "octocat"
+    pr.head.sha = "abc1234"
+    client.get_pr.return_value = pr
+
+    async def iter_files(repo, pr_number):
+        yield PRFile(filename="app.py", status="modified", additions=1, deletions=0, changes=1, patch="@@ -1 +1 @@")
+
+    client.iter_pr_files = Mock(side_effect=iter_files)
+    fetcher = PRFetcher(client)
+
+    first = await fetcher.get_full_pr_data("o/r", 1)
+    second = await fetcher.get_full_pr_data("o/r", 1)
+    assert second is first
+    assert client.iter_pr_files.call_count == 1
+
+    # A new head commit misses the cache
+    pr.head.sha = "def5678"
+    await fetcher.get_full_pr_data("o/r", 1)
+    assert client.iter_pr_files.call_count == 2
+
+
 # Test 8: Language Detection
 def test_language_detection():
     """Test language detection from file extensions."""
@@ -194,6 +326,12 @@ def test_language_detection():
         assert fetcher._detect_language("main.go") == "go"
         assert fetcher._detect_language("lib.rs") == "rust"
         assert fetcher._detect_language("unknown.xyz") == "unknown"
+        assert fetcher._detect_language("Makefile") == "unknown"
+
+        # Fused lookup agrees with the individual helpers
+        assert _classify("src/App.TSX") == ("typescript", False)
+        assert _classify("assets/logo.PNG") == ("unknown", True)
+        assert _classify("dir.v2/.env") == ("unknown", False)
 
 
 # Test 9: Rate Limit Handling
@@ -216,6 +354,85 @@ def test_rate_limit_handling():
             assert rate_info["limit"] == 5000
 
 
+# Test 9b: PR metadata flattening
+def test_pr_summary_from_api():
+    """Test PRSummary flattens the nested REST payload."""
+    summary = PRSummary.from_api({
+        "number": 42,
+        "title": "Fix bug",
+        "state": "open",
+        "html_url": "https://github.com/o/r/pull/42",
+        "user": {"login": "octocat"},
+        "head": {"sha": "abc123", "ref": "feature"},
+        "base": {"sha": "def456", "ref": "main"},
+        "body": None
+    })
+    
+    assert summary.number == 42
+    assert summary.author == "octocat"
+    assert summary.head_sha == "abc123"
+    assert summary.base_ref == "main"
+    assert summary.body == ""
+
+
+# Test 9c: Paginated PR file listing
+@pytest.mark.asyncio
+async def test_get_pr_files_pagination():
+    """Test get_pr_files follows the Link header and fetches every page."""
+    url = "https://api.github.com/repos/o/r/pulls/7/files"
+
+    def page_response(page):
+        headers = {}
+        if page == 1:
+            headers["Link"] = f'<{url}?per_page=100&page=2>; rel="next", <{url}?per_page=100&page=3>; rel="last"'
+        files = [{"filename": f"p{page}.py", "status": "modified", "additions": 1, "deletions": 0, "changes": 1, "patch": "@@"}]
+        return httpx.Response(200, json=files, headers=headers, request=httpx.Request("GET", url))
+
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_test_token"}):
+        client = GitHubClient()
+
+        async def fake_get(url, params=None, headers=None):
+            return page_response(params["page"])
+
+        with patch.object(client.http_client, "get", side_effect=fake_get) as mock_get:
+            files = await client.get_pr_files("o/r", 7)
+
+        assert [f.filename for f in files] == ["p1.py", "p2.py", "p3.py"]
+        assert mock_get.call_count == 3
+        assert all(call.kwargs["params"]["per_page"] == 100 for call in mock_get.call_args_list)
+
+
+# Test 9d: Retry policies
+def test_get_pr_retries_at_one_layer():
+    """Test a transient error retries get_pr's lookup once, not per nested call."""
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_test_token"}):
+        client = GitHubClient()
+        
+        with patch.object(GitHubClient.get_pr.retry, "sleep", Mock()), \
+             patch.object(client.github, "get_repo", side_effect=GithubException(502, "Bad Gateway", None)) as mock_get_repo:
+            with pytest.raises(GithubException):
+                client.get_pr("o", "r", 1)
+        
+        assert mock_get_repo.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_post_not_retried_on_gateway_error():
+    """Test POSTs aren't retried on 502, which may arrive after GitHub applied them."""
+    url = "https://api.github.com/repos/o/r/issues/1/comments"
+    response = httpx.Response(502, request=httpx.Request("POST", url))
+    
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_test_token"}):
+        client = GitHubClient()
+        
+        with patch.object(client.http_client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = response
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.create_issue_comment("o/r", 1, "body")
+        
+        assert mock_post.call_count == 1
+
+
 # Test 10: Error Recovery
 def test_error_recovery():
     """Test graceful error handling for 404 repos."""
@@ -10,6 +10,7 @@ Tests cover:
 """
 
 import pytest
+import asyncio
 import os
 import time
 import jwt
@@ -149,6 +150,35 @@ async def test_client_app_mode(mock_private_key):
         assert token == "ghs_mock_token"
 
 
+# Test 3b: Per-installation request headers
+@pytest.mark.asyncio
+async def test_client_app_mode_headers_per_installation(mock_private_key):
+    """Test concurrent requests for different installations keep their own tokens."""
+    with patch.dict(os.environ, {
+        "GITHUB_APP_ID": str(MOCK_APP_ID),
+        "GITHUB_PRIVATE_KEY_PATH": mock_private_key,
+        "GITHUB_INSTALLATION_ID": str(MOCK_INSTALLATION_ID)
+    }):
+        client = GitHubClient(auth_mode="app")
+        
+        installations = {"org-a/repo": 1, "org-b/repo": 2}
+        client.installation_manager.get_installation_id = AsyncMock(side_effect=installations.get)
+        client.app_auth.get_installation_token = AsyncMock(side_effect=lambda i: f"ghs_install_{i}")
+        
+        headers_a, headers_b = await asyncio.gather(
+            client._request_headers("org-a/repo"),
+            client._request_headers("org-b/repo")
+        )
+        
+        assert headers_a == {"Authorization": "token ghs_install_1"}
+        assert headers_b == {"Authorization": "token ghs_install_2"}
+        assert client._auth_header == {}
+        
+        # Tokens are reused per installation
+        await client._request_headers("org-a/repo")
+        assert client.app_auth.get_installation_token.await_count == 2
+
+
 # Test 4: Installation ID Extraction
 @pytest.mark.asyncio
 async def test_installation_id_extraction():
@@ -7,8 +7,10 @@ import pytest
 from crewai import Task, Agent
 from agents import AgentRegistry
 from tasks import (
-    ParseCodeTask, ComprehensiveReviewTask, FormatCommentsTask, TaskGraph
+    ParseCodeTask, ComprehensiveReviewTask, FormatCommentsTask, TaskGraph,
+    split_by_severity
 )
+from data.models import ReviewFinding
 
 @pytest.fixture
 def agents():
@@ -38,6 +40,18 @@ def test_comprehensive_review_task(agents):
     assert "QUALITY" in task.description
     assert "SECURITY" in task.description
 
+def test_split_by_severity():
+    """Test LOW findings are split from the ones posted inline."""
+    def finding(severity, line):
+        return ReviewFinding(
+            severity=severity, agent_name="Lead Software Engineer", file_path="app.py",
+            line_number=line, issue_description="issue", category="QUALITY"
+        )
+    
+    inline, low = split_by_severity([finding("CRITICAL", 10), finding("HIGH", 20), finding("LOW", 1)])
+    assert [f.line_number for f in inline] == [10, 20]
+    assert [f.line_number for f in low] == [1]
+
 def test_format_comments_task(agents):
     """Test FormatCommentsTask creation."""
     task = FormatCommentsTask().create(
@@ -46,6 +60,20 @@ def test_format_comments_task(agents):
     )
     assert task.output_pydantic is not None
 
+def test_fast_task_construct(agents, monkeypatch):
+    """Test model_construct path still sets up runtime state."""
+    from tasks import task_factory
+    monkeypatch.setattr(task_factory, "FAST_TASK_CONSTRUCT", True)
+    
+    task = ComprehensiveReviewTask().create(
+        agent=agents["comprehensive"],
+        context_tasks=[]
+    )
+    assert isinstance(task, Task)
+    assert task._telemetry is not None
+    assert task.agent is agents["comprehensive"]
+    assert "QUALITY" in task.description
+
 def test_task_graph_sequence(agents):
     """Test TaskGraph sequence generation (Consolidated to 3 tasks)."""
     graph = TaskGraph()
@@ -133,6 +133,19 @@ def test_diff_parser():
     assert test_py is not None
     assert "def test_main():" in test_py.full_content
 
+def test_diff_parser_all_changed_lines():
+    """Test single-pass changed line extraction matches per-file extraction."""
+    parser = DiffParser()
+    
+    with open(DIFF_FILE, "r") as f:
+        diff = f.read()
+    
+    all_lines = parser.get_all_changed_lines(diff)
+    
+    main_py = next(path for path in all_lines if path.endswith("main.py") and "test_" not in path)
+    assert isinstance(all_lines[main_py], frozenset)
+    assert all_lines[main_py] == parser.get_changed_lines(diff, main_py)
+
 def test_finding_aggregator():
     """Test deduplication and sorting."""
     aggregator = FindingAggregator()
@@ -172,6 +185,26 @@ def test_finding_aggregator():
     assert aggregated[0].severity == "HIGH" 
     assert aggregated[1].severity == "LOW"
 
+def test_finding_aggregator_merge_same_line():
+    """Test findings on the same line are merged with the highest severity."""
+    def finding(severity, line, text, category):
+        return ReviewFinding(
+            severity=severity, agent_name="Lead Software Engineer", file_path="app.py",
+            line_number=line, issue_description=text, category=category
+        )
+    
+    aggregator = FindingAggregator()
+    merged = aggregator.merge_same_line([
+        finding("LOW", 10, "naming", "QUALITY"),
+        finding("HIGH", 20, "n+1 query", "PERFORMANCE"),
+        finding("CRITICAL", 10, "hardcoded secret", "SECURITY"),
+    ])
+    assert [(f.line_number, f.severity) for f in merged] == [(10, "CRITICAL"), (20, "HIGH")]
+    assert merged[0].issue_description == "naming; hardcoded secret"
+    
+    unique = [finding("LOW", 1, "a", "QUALITY")]
+    assert aggregator.merge_same_line(unique) is unique
+
 def test_integration_pipeline():
     """Test full pipeline simulation."""
     # 1. Parse diff
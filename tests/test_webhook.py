@@ -11,6 +11,7 @@ Tests cover:
 """
 
 import pytest
+import asyncio
 import json
 import os
 from unittest.mock import Mock, patch, AsyncMock
@@ -304,6 +305,20 @@ async def test_error_notification():
                 mock_error.assert_called_once()
 
 
+# Test 12b: Pipeline limit per event loop
+def test_pipeline_semaphore_per_event_loop():
+    """Test each event loop gets its own pipeline semaphore."""
+    async def acquire_once():
+        sem = WebhookHandler._pipeline_semaphore()
+        async with sem:
+            assert WebhookHandler._pipeline_semaphore() is sem
+        return sem
+    
+    first = asyncio.run(acquire_once())
+    second = asyncio.run(acquire_once())
+    assert first is not second
+
+
 # Test 13: Signature Format Validation
 def test_signature_format_validation():
     """Test signature verification validates format."""
@@ -318,6 +333,12 @@ def test_signature_format_validation():
     
     # None signature
     assert verify_webhook_signature(body, None, secret) is False
+    
+    # Wrong length or non-hex digest is rejected without hashing the body
+    valid = generate_webhook_signature(body, secret)
+    assert verify_webhook_signature(body, valid[:-2], secret) is False
+    assert verify_webhook_signature(body, "sha256=" + "zz" * 32, secret) is False
+    assert verify_webhook_signature(body, "sha256=" + "a " * 32, secret) is False
 
 
 # Test 14: Webhook Logging
@@ -5,13 +5,20 @@ Extracts changed files and code hunks.
 
 from dataclasses import dataclass, field
 import re
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional
 import structlog
 from crewai.agent import BaseTool
-import json
+import orjson
 
 logger = structlog.get_logger()
 
+# diff --git a/path/to/file b/path/to/file
+_FILE_HEADER_RE = re.compile(r'^diff --git a/(.*) b/(.*)')
+# @@ -old_start,old_count +new_start,new_count @@ -> new_start
+_HUNK_NEW_START_RE = re.compile(r'\+(\d+)')
+# Per-file metadata lines, matched with one str.startswith call
+_METADATA_PREFIXES = ('---', '+++', 'index', 'new file', 'deleted file')
+
 @dataclass
 class ChangedFile:
     filename: str
@@ -45,15 +52,11 @@ class DiffParser:
         current_file = None
         current_hunk = []
         
-        # Regex for diff header
-        # diff --git a/path/to/file b/path/to/file
-        file_header_re = re.compile(r'^diff --git a/(.*) b/(.*)')
-        
         lines = diff_content.splitlines()
         
         for line in lines:
             # Check for new file header
-            header_match = file_header_re.match(line)
+            header_match = _FILE_HEADER_RE.match(line)
             if header_match:
                 # Save previous file if exists
                 if current_file:
@@ -71,9 +74,7 @@ class DiffParser:
                 continue
                 
             # Skip file metadata lines
-            if line.startswith('index') or line.startswith('new file') or \
-               line.startswith('deleted file') or line.startswith('---') or \
-               line.startswith('+++'):
+            if line.startswith(_METADATA_PREFIXES):
                 continue
                 
             # Check for binary files
@@ -148,15 +149,13 @@ class DiffParser:
             # Parse hunk header to get starting line number
             # Format: @@ -old_start,old_count +new_start,new_count @@
             if line.startswith('@@'):
-                match = re.search(r'\+(\d+)', line)
+                match = _HUNK_NEW_START_RE.search(line)
                 if match:
                     current_new_line = int(match.group(1))
                 continue
             
             # Skip metadata lines
-            if line.startswith('---') or line.startswith('+++') or \
-               line.startswith('index') or line.startswith('new file') or \
-               line.startswith('deleted file'):
+            if line.startswith(_METADATA_PREFIXES):
                 continue
             
             # Track added/modified lines (lines starting with +)
@@ -173,20 +172,67 @@ class DiffParser:
         logger.info("changed_lines_extracted", file=target_file, count=len(changed_lines))
         return changed_lines
 
+    def get_all_changed_lines(self, diff_content: str) -> Dict[str, FrozenSet[int]]:
+        """
+        Extract added/modified line numbers for every file in a single pass.
+        
+        Same line accounting as get_changed_lines, but the diff is scanned once
+        instead of once per file.
+        
+        Args:
+            diff_content: The full diff content
+            
+        Returns:
+            Dict mapping file path ('b' side) to its changed line numbers
+        """
+        changed: Dict[str, set[int]] = {}
+        current_lines: Optional[set[int]] = None
+        current_new_line = 0
+        
+        for line in diff_content.splitlines():
+            if line.startswith('diff --git'):
+                header_match = _FILE_HEADER_RE.match(line)
+                current_lines = changed.setdefault(header_match.group(2), set()) if header_match else None
+                current_new_line = 0
+                continue
+            
+            if current_lines is None:
+                continue
+            
+            # Hunk header: @@ -old_start,old_count +new_start,new_count @@
+            if line.startswith('@@'):
+                match = _HUNK_NEW_START_RE.search(line)
+                if match:
+                    current_new_line = int(match.group(1))
+                continue
+            
+            # Skip metadata lines
+            if line.startswith(_METADATA_PREFIXES):
+                continue
+            
+            if line.startswith('+') and current_new_line > 0:
+                current_lines.add(current_new_line)
+                current_new_line += 1
+            elif line.startswith(' ') and current_new_line > 0:
+                current_new_line += 1
+        
+        result = {path: frozenset(lines) for path, lines in changed.items()}
+        logger.info("all_changed_lines_extracted", file_count=len(result))
+        return result
+
 class DiffParsingTool(BaseTool):
     name: str = "Diff Parsing"
     description: str = "Parse PR diff to basic file stats. Input is diff string."
 
     def _run(self, diff: str) -> str:
-        parser = DiffParser()
-        files = parser.parse_diff(diff)
-        # Convert to serializable dicts
-        result = []
-        for f in files:
-            result.append({
+        files = DiffParser().parse_diff(diff)
+        # Compact JSON for the next agent; orjson serializes the dicts in C
+        return orjson.dumps([
+            {
                 "filename": f.filename,
                 "language": f.language,
                 "hunks_count": len(f.hunks),
                 "full_content": f.full_content
-            })
-        return json.dumps(result)
+            }
+            for f in files
+        ]).decode()
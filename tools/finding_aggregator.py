@@ -2,24 +2,25 @@
 Aggregator for deduplicating and prioritizing findings.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import structlog
+from pydantic import TypeAdapter
 from data.models import ReviewFinding, ReviewSummary
 from crewai.agent import BaseTool
-import json
+import orjson
 
 logger = structlog.get_logger()
 
+# Compiled serializer for the tool output (one pydantic-core pass over the list)
+_FINDINGS_ADAPTER = TypeAdapter(List[ReviewFinding])
+
+# Sort rank per severity, most severe first; unknown severities rank last
+_SEV_RANK = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
+_SEV_UNKNOWN = len(_SEV_RANK)
+
 class FindingAggregator:
     """Aggregates, deduplicates, and sorts findings from multiple tools."""
     
-    SEVERITY_WEIGHTS = {
-        "CRITICAL": 4,
-        "HIGH": 3,
-        "MEDIUM": 2,
-        "LOW": 1
-    }
-    
     def aggregate(self, findings: List[ReviewFinding]) -> List[ReviewFinding]:
         """
         Deduplicate and sort findings.
@@ -35,6 +36,7 @@ class FindingAggregator:
             
         # Deduplicate based on unique key
         unique_findings = {}
+        rank = _SEV_RANK.get
         
         for f in findings:
             # Create a signature for the finding
@@ -47,14 +49,14 @@ class FindingAggregator:
             else:
                 # If duplicate, keep higher severity
                 existing = unique_findings[key]
-                if self.SEVERITY_WEIGHTS[f.severity] > self.SEVERITY_WEIGHTS[existing.severity]:
+                if rank(f.severity, _SEV_UNKNOWN) < rank(existing.severity, _SEV_UNKNOWN):
                     unique_findings[key] = f
         
         results = list(unique_findings.values())
         
-        # Sort by severity (descending) then line number
+        # Sort by severity (most severe first), then file and line number
         results.sort(key=lambda x: (
-            -self.SEVERITY_WEIGHTS.get(x.severity, 0),
+            rank(x.severity, _SEV_UNKNOWN),
             x.file_path,
             x.line_number or 0
         ))
@@ -67,6 +69,40 @@ class FindingAggregator:
                    unique_count=len(final_results))
                    
         return final_results
+    
+    def merge_same_line(self, findings: List[ReviewFinding]) -> List[ReviewFinding]:
+        """
+        Merge findings that point at the same file and line.
+        
+        Unlike aggregate(), findings in different categories are combined too:
+        descriptions are joined with '; ' and the most severe one is kept, so
+        each location gets at most one inline comment.
+        
+        Args:
+            findings: Findings from the comprehensive review
+            
+        Returns:
+            One finding per (file_path, line_number), in first-seen order
+            (the input list itself when there was nothing to merge)
+        """
+        groups: Dict[Tuple[str, int], List[ReviewFinding]] = {}
+        for f in findings:
+            groups.setdefault((f.file_path, f.line_number), []).append(f)
+        if len(groups) == len(findings):
+            return findings
+        
+        rank = _SEV_RANK.get
+        merged = []
+        for group in groups.values():
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            top = min(group, key=lambda f: rank(f.severity.upper(), _SEV_UNKNOWN))
+            merged.append(group[0].model_copy(update={
+                "severity": top.severity,
+                "issue_description": "; ".join(f.issue_description for f in group),
+            }))
+        return merged
         
     def get_severity_stats(self, findings: List[ReviewFinding]) -> Dict[str, int]:
         """Calculate stats for aggregated findings."""
@@ -92,7 +128,7 @@ class FindingAggregatorTool(BaseTool):
             raw_input = raw_input.split("```")[1].split("```")[0].strip()
             
         try:
-            data = json.loads(raw_input)
+            data = orjson.loads(raw_input)
             # Handle both Single Dict results and List results
             items = data if isinstance(data, list) else [data]
             
@@ -129,4 +165,4 @@ class FindingAggregatorTool(BaseTool):
             logger.error("aggregator_json_failed", error=str(e), raw=raw_input[:100])
             
         aggregated = aggregator.aggregate(all_findings)
-        return json.dumps([f.model_dump() for f in aggregated])
+        return _FINDINGS_ADAPTER.dump_json(aggregated).decode()